@@ -0,0 +1,401 @@
+"""Peak-memory-bounded rendering for the thesis scenes.
+
+At -qh every frame is a 1920x1080 RGBA array of about 8 MB. Stock Manim
+copies the camera's pixel array for each frame it hands to the encoder,
+and queues up to encoder_queue_size of those copies per segment.
+ParallelRenderScene also holds a window of finished frames on top of
+that. BoundedMemoryScene instead rasterizes straight into a small pool of
+preallocated frame buffers. The camera draws into a pooled buffer and the
+encoder gets a view of it. The buffer returns to the pool once the
+encoder drops that view. No per-frame copy or allocation is left, and at
+most ``frame_pool_size`` frames (threads + 2 by default) are alive.
+
+Setting an RSS ceiling (``rss_limit_mb`` or MANIM_RSS_LIMIT_MB) applies
+backpressure whenever resident memory goes above it. The pool stops
+growing, parallel workers may run only one frame ahead of the writer,
+and each new frame waits until the encoder has caught up. Peak RSS is
+sampled on every frame and logged per play and per scene at the end of
+the render. The same numbers go to media/memory/<Scene>.json, for sizing
+render workers.
+
+Peak memory and frame rate with and without the pool:
+    python bounded_memory.py
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from parallel_render import ParallelRenderScene, ScalingBenchmark, default_thread_count
+
+MB = 1024 * 1024
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def rss_bytes():
+    """Current resident set size, or None where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def high_water_bytes():
+    """Peak resident set size of the whole process so far."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class FramePool:
+    """Preallocated frames that come back once the file writer drops them.
+
+    ``lend`` hands the writer a view of a pooled buffer. The buffer is free
+    again once nothing refers to that view any more, i.e. the encoder
+    queue and the encoder thread are done with it. Buffers are allocated
+    on demand, up to ``size``. ``returned`` is notified whenever a buffer
+    comes back, so callers can wait on it instead of polling.
+    """
+
+    def __init__(self, shape, size, dtype=np.uint8):
+        self.shape = shape
+        self.dtype = dtype
+        self.size = size
+        self.free = []
+        self.lent = []
+        # id -> buffer; holding the buffers keeps their ids from being reused
+        self.buffers = {}
+        self.lends = 0
+        # Reentrant: a view can die, and notify, while its thread holds the lock
+        self.lock = threading.RLock()
+        self.returned = threading.Condition(self.lock)
+
+    @property
+    def allocated(self):
+        return len(self.buffers)
+
+    @property
+    def reused(self):
+        return max(self.lends - self.allocated, 0)
+
+    @property
+    def nbytes(self):
+        return self.allocated * int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def _reclaim(self):
+        lent = []
+        for buffer, view in self.lent:
+            if view() is None:
+                self.free.append(buffer)
+            else:
+                lent.append((buffer, view))
+        self.lent = lent
+
+    def try_acquire(self, grow=True):
+        """A free buffer, a new one if ``grow`` and the pool is not full, else None."""
+        with self.lock:
+            self._reclaim()
+            if self.free:
+                return self.free.pop()
+            if grow and self.allocated < self.size:
+                buffer = np.empty(self.shape, self.dtype)
+                self.buffers[id(buffer)] = buffer
+                return buffer
+        return None
+
+    def release(self, buffer):
+        """Return a buffer that was acquired but not lent."""
+        with self.returned:
+            self.free.append(buffer)
+            self.returned.notify_all()
+
+    def lend(self, buffer):
+        view = buffer.view()
+        with self.lock:
+            self.lent.append((buffer, weakref.ref(view, self._view_dropped)))
+            self.lends += 1
+        return view
+
+    def _view_dropped(self, _):
+        with self.returned:
+            self.returned.notify_all()
+
+    def owns(self, frame):
+        return self.buffers.get(id(frame)) is frame
+
+    def in_use(self):
+        """Buffers the writer still holds."""
+        with self.lock:
+            self._reclaim()
+            return len(self.lent)
+
+
+class PooledCairoRenderer(CairoRenderer):
+    """CairoRenderer that rasterizes into the scene's pooled frames."""
+
+    def render(self, scene, time, moving_mobjects=None):
+        frame = scene.acquire_frame()
+        camera = self.camera
+        own = camera.pixel_array
+        if frame is not None:
+            camera.pixel_array = frame
+        try:
+            self.update_frame(scene, moving_mobjects)
+        except BaseException:
+            if frame is not None:
+                scene.release_frame(frame)
+            raise
+        finally:
+            camera.pixel_array = own
+        scene.write_frame(frame if frame is not None else self.get_frame())
+
+
+class BoundedMemoryScene(ParallelRenderScene):
+    """Scene rendered through a frame pool, with an optional RSS ceiling."""
+
+    rss_limit_mb = None
+    frame_pool_size = None
+    throttle_timeout = 2.0
+    write_memory_report = True
+
+    def __init__(self, *args, **kwargs):
+        if config.renderer == RendererType.CAIRO and kwargs.get("renderer") is None:
+            kwargs["renderer"] = PooledCairoRenderer(
+                camera_class=kwargs.get("camera_class", Camera),
+                skip_animations=kwargs.get("skip_animations", False),
+            )
+        super().__init__(*args, **kwargs)
+        limit = self.rss_limit_mb or float(os.environ.get("MANIM_RSS_LIMIT_MB", 0))
+        self.rss_limit = limit * MB if limit else None
+        self.frame_pool = None
+        self.memory = []
+        self.current_play = None
+        self.peak_rss = rss_bytes() or 0
+        self.stats_lock = threading.Lock()
+        # Warnings already logged for this scene; per-play counts go to the report
+        self.warned = set()
+
+    def over_limit(self):
+        if self.rss_limit is None:
+            return False
+        rss = rss_bytes()
+        return rss is not None and rss > self.rss_limit
+
+    def sample_rss(self):
+        rss = rss_bytes() or 0
+        self.peak_rss = max(self.peak_rss, rss)
+        if self.current_play is not None:
+            self.current_play["peak"] = max(self.current_play["peak"], rss)
+        return rss
+
+    def frame_window(self, threads):
+        # Every frame a worker runs ahead holds a pooled buffer; leave two
+        # for the frame being encoded and the one queued behind it
+        return max(min(self.render_window or threads, self.frame_pool.size - 2), 1)
+
+    def acquire_frame(self):
+        pool = self.frame_pool
+        start = time.perf_counter()
+        deadline = start + self.throttle_timeout
+        with pool.returned:
+            while True:
+                # Above the ceiling, rasterize only once the encoder has
+                # drained (its thread keeps the last frame until the next
+                # one arrives)
+                over = self.over_limit()
+                drained = pool.in_use() <= 1
+                if not over or drained:
+                    frame = pool.try_acquire()
+                    if frame is not None:
+                        break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    # Gave up on the encoder: a free buffer is still better
+                    # than a copy
+                    frame = pool.try_acquire(grow=False)
+                    break
+                pool.returned.wait(remaining)
+
+        waited = time.perf_counter() - start
+        with self.stats_lock:
+            play = self.current_play
+            play["throttled_s"] += waited
+            if frame is None:
+                play["copies"] += 1
+                if "exhausted" not in self.warned:
+                    self.warned.add("exhausted")
+                    ceiling = f", above the {self.rss_limit / MB:.0f} MB ceiling" if over else ""
+                    logger.warning(
+                        f"Frame pool exhausted ({pool.allocated} buffers still with the "
+                        f"encoder after {waited:.1f} s), allocating a frame outside the pool"
+                        f"{ceiling} (first in play {play['play']}; copies per play are in "
+                        f"the memory report)"
+                    )
+            elif over and drained:
+                # The encoder caught up and memory is still too high; the
+                # scene itself (or the process baseline) is too big
+                play["drained_over"] += 1
+                if "ceiling" not in self.warned:
+                    self.warned.add("ceiling")
+                    logger.warning(
+                        f"RSS {(rss_bytes() or 0) / MB:.0f} MB is still above the "
+                        f"{self.rss_limit / MB:.0f} MB ceiling after the encoder drained "
+                        f"(first in play {play['play']}; frames per play are in the "
+                        f"memory report)"
+                    )
+        return frame
+
+    def release_frame(self, frame):
+        if self.frame_pool.owns(frame):
+            self.frame_pool.release(frame)
+
+    def write_frame(self, frame):
+        self.sample_rss()
+        over = self.over_limit()
+        if self.reorder_buffer is not None:
+            self.reorder_buffer.throttle(over)
+        self.current_play["frames"] += not self.renderer.skip_animations
+        self.current_play["over_limit"] += over
+        if self.frame_pool.owns(frame):
+            frame = self.frame_pool.lend(frame)
+        self.renderer.add_frame(frame)
+
+    def play_internal(self, skip_rendering=False):
+        if self.frame_pool is None:
+            threads = self.render_threads or default_thread_count()
+            self.frame_pool = FramePool(
+                self.renderer.camera.pixel_array.shape,
+                self.frame_pool_size or threads + 2,
+            )
+        rss = rss_bytes() or 0
+        self.current_play = {
+            "play": self.renderer.num_plays, "t": self.renderer.time, "start": rss, "peak": rss,
+            "frames": 0, "over_limit": 0, "drained_over": 0, "copies": 0, "throttled_s": 0.0,
+        }
+        try:
+            super().play_internal(skip_rendering)
+        finally:
+            self.sample_rss()
+            play, self.current_play = self.current_play, None
+
+        self.memory.append({
+            "play": play["play"],
+            "t": round(play["t"], 4),
+            "frames": play["frames"],
+            "start_rss_mb": round(play["start"] / MB, 1),
+            "peak_rss_mb": round(play["peak"] / MB, 1),
+            "pool_buffers": self.frame_pool.allocated,
+            "pool_mb": round(self.frame_pool.nbytes / MB, 1),
+            "copied_frames": play["copies"],
+            "over_limit_frames": play["over_limit"],
+            "drained_over_frames": play["drained_over"],
+            "throttled_s": round(play["throttled_s"], 3),
+        })
+
+    def tear_down(self):
+        super().tear_down()
+        self.sample_rss()
+        # Renders skipped with -s write no frames; nothing to size
+        if any(m["frames"] for m in self.memory):
+            self.report_memory()
+
+    def report_memory(self):
+        limit = f"{self.rss_limit / MB:.0f} MB ceiling" if self.rss_limit else "no ceiling"
+        high_water = high_water_bytes()
+        lines = [
+            f"Memory {type(self).__name__}: peak RSS {self.peak_rss / MB:.0f} MB"
+            + (f" (process high-water {high_water / MB:.0f} MB)" if high_water else "")
+            + f", {limit}, {self.frame_pool.allocated} pooled frames "
+            f"({self.frame_pool.nbytes / MB:.0f} MB), {self.frame_pool.reused} reuses",
+            f"{'play':>6}{'frames':>8}{'start MB':>10}{'peak MB':>9}{'copied':>8}{'over':>6}"
+            f"{'drained over':>14}{'throttled s':>13}",
+        ]
+        for m in self.memory:
+            lines.append(
+                f"{m['play']:>6}{m['frames']:>8}{m['start_rss_mb']:>10.0f}{m['peak_rss_mb']:>9.0f}"
+                f"{m['copied_frames']:>8}{m['over_limit_frames']:>6}{m['drained_over_frames']:>14}"
+                f"{m['throttled_s']:>13.2f}"
+            )
+        logger.info("\n".join(lines))
+
+        if self.write_memory_report and not self.session_spec.dry_run:
+            out_dir = Path(config.get_dir("media_dir")) / "memory"
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path = out_dir / f"{type(self).__name__}.json"
+            path.write_text(json.dumps({
+                "scene": type(self).__name__,
+                "rss_limit_mb": self.rss_limit / MB if self.rss_limit else None,
+                "peak_rss_mb": round(self.peak_rss / MB, 1),
+                "high_water_mb": round(high_water / MB, 1) if high_water else None,
+                "frame_pool": {
+                    "size": self.frame_pool.size,
+                    "allocated": self.frame_pool.allocated,
+                    "reused": self.frame_pool.reused,
+                },
+                "plays": self.memory,
+            }, indent=1))
+            logger.info(f"Memory report written to {path}")
+
+
+# Benchmark
+
+class BoundedBenchmark(BoundedMemoryScene, ScalingBenchmark):
+    write_memory_report = False
+
+
+def benchmark(quality="high_quality", threads=None, rss_limit_mb=None):
+    """Render the parallel benchmark scene stock and pooled; compare peak
+    RSS above the starting point, frame rate and frame hashes."""
+    results = []
+    for scene_cls in (ScalingBenchmark, BoundedBenchmark):
+        hashes = []
+        with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+            "quality": quality, "media_dir": media_dir,
+            "disable_caching": True, "progress_bar": "none", "verbosity": "WARNING",
+        }):
+            scene = scene_cls()
+            scene.render_threads = threads
+            if rss_limit_mb is not None and isinstance(scene, BoundedMemoryScene):
+                scene.rss_limit = rss_limit_mb * MB
+            add_frame = scene.renderer.add_frame
+            base = rss_bytes() or 0
+            peak = [base]
+
+            def sampling_add_frame(frame, num_frames=1):
+                hashes.append(hashlib.sha1(frame.tobytes()).hexdigest())
+                add_frame(frame, num_frames)
+                peak[0] = max(peak[0], rss_bytes() or 0)
+
+            scene.renderer.add_frame = sampling_add_frame
+            start = time.perf_counter()
+            scene.render()
+            elapsed = time.perf_counter() - start
+        results.append((scene_cls.__name__, len(hashes), elapsed, (peak[0] - base) / MB, hashes))
+
+    stock = results[0]
+    print(f"{quality}, {threads or default_thread_count()} threads, "
+          f"{'no ceiling' if rss_limit_mb is None else f'{rss_limit_mb} MB ceiling'}")
+    print(f"{'scene':<20}{'frames':>8}{'fps':>8}{'peak RSS +MB':>14}  identical")
+    for name, frames, elapsed, peak_mb, hashes in results:
+        print(f"{name:<20}{frames:>8}{frames / elapsed:>8.1f}{peak_mb:>14.0f}  {hashes == stock[4]}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
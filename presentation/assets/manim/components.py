@@ -0,0 +1,57 @@
+"""Reusable diagram components shared by the thesis scenes.
+
+Camera icons, the "Neural Network" box, pixel grids and photo frames are
+drawn in several scenes, some of them inside loops. Each builder returns
+a fresh mobject centered on the origin; the caller positions it.
+"""
+
+from manim import *
+
+
+def camera_icon(width=1.2, height=0.9, lens_radius=0.25, body_color=GRAY_D, lens_color="#00b3e7"):
+    """Camera body with a round lens: VGroup(body, lens)."""
+    body = RoundedRectangle(
+        width=width, height=height, corner_radius=0.1,
+        fill_color=body_color, fill_opacity=1, stroke_color=WHITE
+    )
+    lens = Circle(radius=lens_radius, fill_color=lens_color, fill_opacity=1, stroke_color=WHITE)
+    return VGroup(body, lens)
+
+
+def network_box(width, height, color="#00b3e7", title="Neural Network", title_size=20, title_buff=0.4):
+    """Rounded network box with its title ``title_buff`` below the top: VGroup(box, title)."""
+    box = RoundedRectangle(
+        width=width, height=height, corner_radius=0.15,
+        fill_color="#1a1a2e", fill_opacity=0.9,
+        stroke_color=color, stroke_width=2
+    )
+    label = Text(title, font_size=title_size, color=color)
+    label.move_to(box.get_top() + DOWN * title_buff)
+    return VGroup(box, label)
+
+
+def pixel_grid(rows=4, cols=3, size=0.3, color=GRAY, stroke_width=1):
+    """rows x cols square pixels, bottom row first, each row left to right."""
+    pixel = Rectangle(width=size, height=size, stroke_color=color, stroke_width=stroke_width)
+    grid = VGroup()
+    for i in range(rows):
+        for j in range(cols):
+            cell = pixel.copy()
+            cell.move_to(RIGHT * (j - (cols - 1) / 2) * size + UP * (i - (rows - 1) / 2) * size)
+            grid.add(cell)
+    return grid
+
+
+def photo_frame(width=1.2, height=0.9, icon="square", icon_size=0.3, icon_color="#00b3e7",
+                icon_opacity=0.7, fill_color=GRAY_D, stroke_color=WHITE):
+    """Photo with a simple object icon in the middle: VGroup(frame, icon).
+
+    ``icon`` is "square" (side ``icon_size``) or "circle" (radius ``icon_size``).
+    """
+    frame = Rectangle(width=width, height=height, fill_color=fill_color, fill_opacity=0.8,
+                      stroke_color=stroke_color)
+    if icon == "circle":
+        mark = Circle(radius=icon_size, fill_color=icon_color, fill_opacity=icon_opacity, stroke_width=0)
+    else:
+        mark = Square(side_length=icon_size, fill_color=icon_color, fill_opacity=icon_opacity, stroke_width=0)
+    return VGroup(frame, mark)
@@ -0,0 +1,467 @@
+"""Fit a field of 2D anisotropic Gaussians to an image on the CPU.
+
+A small, real version of the 3DGS training loop shown in
+GaussianSplattingTraining: render, compare, adjust, and adaptive
+densification (split large Gaussians, clone small ones in under-fitted
+areas, prune near-transparent ones).
+
+The image model is additive splatting (no depth in 2D):
+
+    I(p) = sum_i sigmoid(a_i) * c_i * exp(-0.5 * d^T Sigma_i^-1 d),  d = p - mu_i
+
+Each Gaussian only touches a fixed (2R+1)^2 pixel patch around its center
+(scales are clamped so 3 sigma stays inside it). Forward and backward
+passes are analytic and vectorized over all Gaussians x patch pixels.
+All per-Gaussian buffers are allocated once for ``capacity`` Gaussians
+and reused every iteration.
+
+Benchmark:
+    python gaussian_fit.py
+"""
+
+import time
+
+import numpy as np
+
+# Parameter layout of one row of GaussianImageFitter.params
+MX, MY, LSX, LSY, THETA, R, G, B, OPACITY = range(9)
+NUM_PARAMS = 9
+
+DEFAULT_LR = np.array([
+    0.25, 0.25,         # position (pixels)
+    0.02, 0.02,         # log scale
+    0.03,               # rotation
+    0.02, 0.02, 0.02,   # color
+    0.05,               # opacity logit
+], dtype=np.float32)
+
+
+def sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+class GaussianImageFitter:
+    """Adam optimizer for 2D Gaussians against a target image.
+
+    target: (H, W, 3) float image in [0, 1].
+    """
+
+    def __init__(self, target, num_gaussians=500, capacity=4000, radius=5,
+                 lr=DEFAULT_LR, init_scale=1.5, init_opacity=0.3,
+                 densify_every=50, densify_until=None, grad_threshold=0.15,
+                 split_scale=None, prune_opacity=0.02, seed=0):
+        self.target = np.asarray(target, dtype=np.float32)
+        self.height, self.width = self.target.shape[:2]
+        self.num_pixels = self.height * self.width
+        self.capacity = capacity
+        self.radius = radius
+        self.lr = np.asarray(lr, dtype=np.float32)
+        self.densify_every = densify_every
+        self.densify_until = densify_until
+        self.grad_threshold = grad_threshold
+        self.prune_opacity = prune_opacity
+        self.rng = np.random.default_rng(seed)
+
+        # Scales are clamped so the 3 sigma ellipse stays inside the patch
+        self.min_log_scale = np.log(0.3)
+        self.max_log_scale = np.log(radius / 3.0)
+        self.split_scale = 0.6 * radius / 3.0 if split_scale is None else split_scale
+
+        # Extra last pixel collects every patch sample that falls outside
+        # the image; its target and gradient are kept at zero
+        self.flat_target = np.zeros((self.num_pixels + 1, 3), dtype=np.float32)
+        self.flat_target[:-1] = self.target.reshape(-1, 3)
+
+        ys, xs = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+        self.offset_x = xs.ravel().astype(np.int32)
+        self.offset_y = ys.ravel().astype(np.int32)
+        k = self.offset_x.size
+
+        # Optimizer state
+        self.n = 0
+        self.iteration = 0
+        self.params = np.zeros((capacity, NUM_PARAMS), dtype=np.float32)
+        self.grads = np.zeros((capacity, NUM_PARAMS), dtype=np.float32)
+        self.adam_m = np.zeros((capacity, NUM_PARAMS), dtype=np.float32)
+        self.adam_v = np.zeros((capacity, NUM_PARAMS), dtype=np.float32)
+        self.adam_t = np.zeros(capacity, dtype=np.int32)
+        self.grad_accum = np.zeros(capacity, dtype=np.float32)
+        self.grad_count = np.zeros(capacity, dtype=np.int32)
+
+        # Per-iteration work buffers, (capacity, K) unless noted
+        self._px = np.empty((capacity, k), dtype=np.int32)
+        self._py = np.empty((capacity, k), dtype=np.int32)
+        self._idx = np.empty((capacity, k), dtype=np.int64)
+        self._valid = np.empty((capacity, k), dtype=bool)
+        self._mask = np.empty((capacity, k), dtype=bool)
+        self._dx = np.empty((capacity, k), dtype=np.float32)
+        self._dy = np.empty((capacity, k), dtype=np.float32)
+        self._u = np.empty((capacity, k), dtype=np.float32)
+        self._v = np.empty((capacity, k), dtype=np.float32)
+        self._gauss = np.empty((capacity, k), dtype=np.float32)
+        self._weight = np.empty((capacity, k), dtype=np.float32)
+        self._tmp = np.empty((capacity, k), dtype=np.float32)
+        self._tmp2 = np.empty((capacity, k), dtype=np.float32)
+        self._grad_w = np.empty((capacity, k), dtype=np.float32)
+        self._gather = np.empty((3, capacity, k), dtype=np.float32)
+        self._cos = np.empty(capacity, dtype=np.float32)
+        self._sin = np.empty(capacity, dtype=np.float32)
+        self._inv_sx2 = np.empty(capacity, dtype=np.float32)
+        self._inv_sy2 = np.empty(capacity, dtype=np.float32)
+        self._opacity = np.empty(capacity, dtype=np.float32)
+        self._bias = np.empty((capacity, 1), dtype=np.float32)
+        self._step = np.empty((capacity, NUM_PARAMS), dtype=np.float32)
+        self._step2 = np.empty((capacity, NUM_PARAMS), dtype=np.float32)
+        self.image = np.zeros((self.num_pixels + 1, 3), dtype=np.float32)
+        self._grad_image = np.zeros((self.num_pixels + 1, 3), dtype=np.float32)
+
+        self.loss = float("nan")
+        self.stats = {"split": 0, "cloned": 0, "pruned": 0}
+        self.last_densify = None
+        self.add_random(num_gaussians, init_scale, init_opacity)
+
+    # Setup
+
+    def add_random(self, count, scale, opacity):
+        """Append ``count`` Gaussians at random pixels, colored from the target."""
+        count = min(count, self.capacity - self.n)
+        rows = slice(self.n, self.n + count)
+        xs = self.rng.uniform(0, self.width, count)
+        ys = self.rng.uniform(0, self.height, count)
+        p = self.params[rows]
+        p[:, MX] = xs
+        p[:, MY] = ys
+        p[:, LSX:LSY + 1] = np.log(scale)
+        p[:, THETA] = self.rng.uniform(0, np.pi, count)
+        p[:, R:B + 1] = self.target[ys.astype(int), xs.astype(int)]
+        p[:, OPACITY] = np.log(opacity / (1 - opacity))
+        self._reset_state(rows)
+        self.n += count
+
+    def _reset_state(self, rows):
+        self.adam_m[rows] = 0
+        self.adam_v[rows] = 0
+        self.adam_t[rows] = 0
+        self.grad_accum[rows] = 0
+        self.grad_count[rows] = 0
+
+    # Forward / backward
+
+    def render(self):
+        """Rasterize the active Gaussians into ``self.image``; returns (H, W, 3)."""
+        n = self.n
+        p = self.params[:n]
+        px, py, idx = self._px[:n], self._py[:n], self._idx[:n]
+        valid, mask = self._valid[:n], self._mask[:n]
+        dx, dy, u, v = self._dx[:n], self._dy[:n], self._u[:n], self._v[:n]
+        gauss, weight, tmp = self._gauss[:n], self._weight[:n], self._tmp[:n]
+        cos, sin = self._cos[:n], self._sin[:n]
+        inv_sx2, inv_sy2, opacity = self._inv_sx2[:n], self._inv_sy2[:n], self._opacity[:n]
+
+        # Patch pixel coordinates and flat indices
+        np.add(np.floor(p[:, MX]).astype(np.int32)[:, None], self.offset_x, out=px)
+        np.add(np.floor(p[:, MY]).astype(np.int32)[:, None], self.offset_y, out=py)
+        np.multiply(py, self.width, out=idx)
+        idx += px
+        np.greater_equal(px, 0, out=valid)
+        valid &= np.less(px, self.width, out=mask)
+        valid &= np.greater_equal(py, 0, out=mask)
+        valid &= np.less(py, self.height, out=mask)
+        np.logical_not(valid, out=mask)
+        np.copyto(idx, self.num_pixels, where=mask)
+
+        # Offsets from the mean, rotated into the Gaussian's frame
+        np.add(px, 0.5, out=dx)
+        dx -= p[:, MX, None]
+        np.add(py, 0.5, out=dy)
+        dy -= p[:, MY, None]
+        np.cos(p[:, THETA], out=cos)
+        np.sin(p[:, THETA], out=sin)
+        np.multiply(dx, cos[:, None], out=u)
+        u += np.multiply(dy, sin[:, None], out=tmp)
+        np.multiply(dy, cos[:, None], out=v)
+        v -= np.multiply(dx, sin[:, None], out=tmp)
+
+        np.exp(-2.0 * p[:, LSX], out=inv_sx2)
+        np.exp(-2.0 * p[:, LSY], out=inv_sy2)
+        np.multiply(u, u, out=gauss)
+        gauss *= inv_sx2[:, None]
+        np.multiply(v, v, out=tmp)
+        tmp *= inv_sy2[:, None]
+        gauss += tmp
+        gauss *= -0.5
+        np.exp(gauss, out=gauss)
+
+        opacity[:] = sigmoid(p[:, OPACITY])
+        np.multiply(gauss, opacity[:, None], out=weight)
+
+        flat_idx = idx.ravel()
+        for c in range(3):
+            np.multiply(weight, p[:, R + c, None], out=tmp)
+            self.image[:, c] = np.bincount(flat_idx, weights=tmp.ravel(), minlength=self.num_pixels + 1)
+        self.image[-1] = 0
+        return self.image[:-1].reshape(self.height, self.width, 3)
+
+    def backward(self):
+        """Gradients of the mean squared error w.r.t. all parameters."""
+        n = self.n
+        p = self.params[:n]
+        grads = self.grads[:n]
+        idx, u, v = self._idx[:n], self._u[:n], self._v[:n]
+        gauss, weight, tmp, tmp2 = self._gauss[:n], self._weight[:n], self._tmp[:n], self._tmp2[:n]
+        grad_w = self._grad_w[:n]
+        cos, sin = self._cos[:n], self._sin[:n]
+        inv_sx2, inv_sy2, opacity = self._inv_sx2[:n], self._inv_sy2[:n], self._opacity[:n]
+
+        np.subtract(self.image, self.flat_target, out=self._grad_image)
+        self._grad_image[-1] = 0
+        self.loss = float(np.mean(self._grad_image[:-1] ** 2))
+        self._grad_image *= 2.0 / (self.num_pixels * 3)
+
+        # dL/dw for each patch sample, plus color gradients
+        grad_w.fill(0)
+        for c in range(3):
+            gathered = self._gather[c, :n]
+            np.take(self._grad_image[:, c], idx, out=gathered)
+            grads[:, R + c] = np.einsum("nk,nk->n", gathered, weight)
+            grad_w += np.multiply(gathered, p[:, R + c, None], out=tmp)
+
+        # Opacity: w = o * G
+        grads[:, OPACITY] = np.einsum("nk,nk->n", grad_w, gauss) * opacity * (1 - opacity)
+
+        # dL/dq = dL/dG * dG/dq, with dG/dq = -G/2 and dL/dG = dL/dw * o
+        grad_q = grad_w
+        grad_q *= weight
+        grad_q *= -0.5
+
+        # Scales: q = u^2 / sx^2 + v^2 / sy^2
+        np.multiply(u, u, out=tmp)
+        grads[:, LSX] = -2.0 * inv_sx2 * np.einsum("nk,nk->n", grad_q, tmp)
+        np.multiply(v, v, out=tmp)
+        grads[:, LSY] = -2.0 * inv_sy2 * np.einsum("nk,nk->n", grad_q, tmp)
+
+        # Rotation: du/dtheta = v, dv/dtheta = -u
+        np.multiply(u, v, out=tmp)
+        grads[:, THETA] = 2.0 * (inv_sx2 - inv_sy2) * np.einsum("nk,nk->n", grad_q, tmp)
+
+        # Position: d = p - mu, so dL/dmu = -dL/dd
+        np.multiply(grad_q, u, out=tmp)
+        tmp *= 2.0 * inv_sx2[:, None]          # dL/du
+        np.multiply(grad_q, v, out=tmp2)
+        tmp2 *= 2.0 * inv_sy2[:, None]         # dL/dv
+        grad_u = tmp.sum(axis=1)
+        grad_v = tmp2.sum(axis=1)
+        grads[:, MX] = -(grad_u * cos - grad_v * sin)
+        grads[:, MY] = -(grad_u * sin + grad_v * cos)
+        return grads
+
+    # Optimization
+
+    def adam_step(self, beta1=0.9, beta2=0.999, eps=1e-8):
+        n = self.n
+        g = self.grads[:n]
+        m = self.adam_m[:n]
+        v = self.adam_v[:n]
+        step, step2, bias = self._step[:n], self._step2[:n], self._bias[:n]
+        self.adam_t[:n] += 1
+        t = self.adam_t[:n, None]
+
+        m *= beta1
+        m += np.multiply(g, 1 - beta1, out=step)
+        v *= beta2
+        np.multiply(g, g, out=step)
+        v += np.multiply(step, 1 - beta2, out=step)
+
+        # lr * m_hat / (sqrt(v_hat) + eps), bias corrections per Gaussian
+        np.power(beta1, t, out=bias)
+        np.subtract(1, bias, out=bias)
+        np.divide(m, bias, out=step)
+        np.power(beta2, t, out=bias)
+        np.subtract(1, bias, out=bias)
+        np.divide(v, bias, out=step2)
+        np.sqrt(step2, out=step2)
+        step2 += eps
+        step /= step2
+        step *= self.lr
+        self.params[:n] -= step
+
+        p = self.params[:n]
+        np.clip(p[:, LSX:LSY + 1], self.min_log_scale, self.max_log_scale, out=p[:, LSX:LSY + 1])
+        np.clip(p[:, MX], 0, self.width - 1e-3, out=p[:, MX])
+        np.clip(p[:, MY], 0, self.height - 1e-3, out=p[:, MY])
+
+    def step(self):
+        """One render / compare / adjust iteration; returns the loss."""
+        self.render()
+        self.backward()
+
+        # Positional gradient of the per-pixel summed error, so the
+        # densification threshold does not depend on the image size
+        n = self.n
+        self.grad_accum[:n] += np.hypot(self.grads[:n, MX], self.grads[:n, MY]) * self.num_pixels
+        self.grad_count[:n] += 1
+        self.adam_step()
+        self.iteration += 1
+
+        if (self.densify_every and self.iteration % self.densify_every == 0
+                and (self.densify_until is None or self.iteration <= self.densify_until)):
+            self.densify_and_prune()
+        return self.loss
+
+    def densify_and_prune(self):
+        """Split / clone Gaussians with large positional gradients, prune faint ones.
+
+        What happened is kept in ``last_densify``: the Gaussians before the
+        step, the indices that were split and cloned, and ``moved_to``, the
+        index after the step of every row before compaction (-1 if pruned).
+        Split parent ``split[k]`` has children at rows ``split[k]`` and
+        ``count + k``; clone source ``cloned[k]`` has its copy at row
+        ``count + len(split) + k``.
+        """
+        n = self.n
+        p = self.params
+        before = self.gaussians()
+        avg_grad = self.grad_accum[:n] / np.maximum(self.grad_count[:n], 1)
+        candidates = np.flatnonzero(avg_grad > self.grad_threshold)
+
+        # Never grow past the preallocated capacity: keep the strongest
+        room = self.capacity - n
+        if len(candidates) > room:
+            candidates = candidates[np.argsort(avg_grad[candidates])[::-1][:room]]
+
+        scales = np.exp(p[candidates, LSX:LSY + 1])
+        big = scales.max(axis=1) > self.split_scale
+        split, clone = candidates[big], candidates[~big]
+
+        new = slice(n, n + len(candidates))
+        p[new.start:new.start + len(split)] = p[split]
+        p[new.start + len(split):new.stop] = p[clone]
+
+        # SPLIT: two children sampled inside the parent, 1.6x smaller
+        if len(split):
+            children = np.concatenate([split, np.arange(new.start, new.start + len(split))])
+            sx = np.exp(p[children, LSX])
+            sy = np.exp(p[children, LSY])
+            cos, sin = np.cos(p[children, THETA]), np.sin(p[children, THETA])
+            a = self.rng.normal(size=len(children)) * sx
+            b = self.rng.normal(size=len(children)) * sy
+            p[children, MX] += a * cos - b * sin
+            p[children, MY] += a * sin + b * cos
+            p[children, LSX:LSY + 1] -= np.log(1.6)
+
+        # CLONE: a copy nudged against the positional gradient
+        if len(clone):
+            copies = np.arange(new.start + len(split), new.stop)
+            direction = -self.grads[clone, MX:MY + 1]
+            direction /= np.linalg.norm(direction, axis=1, keepdims=True) + 1e-12
+            p[copies, MX:MY + 1] += direction * np.exp(p[clone, LSX:LSY + 1]).max(axis=1, keepdims=True)
+
+        self._reset_state(new)
+        self.n = new.stop
+        np.clip(p[:self.n, MX], 0, self.width - 1e-3, out=p[:self.n, MX])
+        np.clip(p[:self.n, MY], 0, self.height - 1e-3, out=p[:self.n, MY])
+
+        # PRUNE: compact the survivors in place, keeping their Adam state
+        keep = sigmoid(p[:self.n, OPACITY]) >= self.prune_opacity
+        kept = int(keep.sum())
+        for array in (self.params, self.adam_m, self.adam_v, self.adam_t):
+            array[:kept] = array[:self.n][keep]
+        pruned = self.n - kept
+        self.n = kept
+
+        self.grad_accum[:self.n] = 0
+        self.grad_count[:self.n] = 0
+        self.stats["split"] += len(split)
+        self.stats["cloned"] += len(clone)
+        self.stats["pruned"] += pruned
+        self.last_densify = {
+            "iteration": self.iteration,
+            "count": n,
+            "before": before,
+            "split": split,
+            "cloned": clone,
+            "pruned": pruned,
+            "moved_to": np.where(keep, np.cumsum(keep) - 1, -1),
+        }
+
+    def gaussians(self):
+        """Means, scales, angles, colors and opacities of the active Gaussians (copies)."""
+        p = self.params[:self.n]
+        return {
+            "means": p[:, MX:MY + 1].copy(),
+            "scales": np.exp(p[:, LSX:LSY + 1]),
+            "angles": p[:, THETA].copy(),
+            "colors": np.clip(p[:, R:B + 1], 0, 1),
+            "opacities": sigmoid(p[:, OPACITY]),
+        }
+
+    def snapshot(self):
+        """Copy of the current state, safe to keep while training continues."""
+        image = np.clip(self.render(), 0, 1).copy()
+        return {
+            "iteration": self.iteration,
+            "loss": float(np.mean((image - self.target) ** 2)),
+            "count": self.n,
+            **self.gaussians(),
+            "image": image,
+            "stats": dict(self.stats),
+            "densify": self.last_densify,
+        }
+
+    def run(self, iterations, snapshot_at=()):
+        """Train for ``iterations`` steps, yielding snapshots as they happen.
+
+        Snapshots taken on a densification iteration show the state after
+        it, with ``densify`` describing the step. The initial Gaussians
+        are included if 0 is in ``snapshot_at``.
+        """
+        snapshot_at = set(snapshot_at)
+        if 0 in snapshot_at and self.iteration == 0:
+            yield self.snapshot()
+        for _ in range(iterations):
+            self.step()
+            if self.iteration in snapshot_at:
+                yield self.snapshot()
+
+
+def disk_target(width, height, center, radius, color, background, rim_color=None, rim_width=1.0):
+    """Anti-aliased disk on a flat background, a stand-in for a training photo."""
+    ys, xs = np.mgrid[0:height, 0:width] + 0.5
+    dist = np.hypot(xs - center[0], ys - center[1])
+    inside = np.clip(radius - dist + 0.5, 0, 1)[..., None]
+    image = np.asarray(background, dtype=np.float32) * (1 - inside) + np.asarray(color, dtype=np.float32) * inside
+    if rim_color is not None:
+        rim = np.clip(rim_width / 2 - np.abs(dist - radius) + 0.5, 0, 1)[..., None]
+        image = image * (1 - rim) + np.asarray(rim_color, dtype=np.float32) * rim
+    return image.astype(np.float32)
+
+
+def benchmark(width=128, height=96, num_gaussians=3000, iterations=100):
+    ys, xs = np.mgrid[0:height, 0:width] / np.array([height, width])[:, None, None]
+    target = np.stack([
+        0.5 + 0.5 * np.sin(6 * xs),
+        0.5 + 0.5 * np.cos(5 * ys + 2 * xs),
+        disk_target(width, height, (width / 2, height / 2), height / 4, (1, 1, 1), (0, 0, 0))[..., 0],
+    ], axis=-1).astype(np.float32)
+
+    fitter = GaussianImageFitter(target, num_gaussians=num_gaussians, capacity=num_gaussians,
+                                 densify_every=0)
+    fitter.step()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fitter.step()
+    elapsed = time.perf_counter() - start
+    print(f"{num_gaussians} Gaussians, {width}x{height} target, patch {2 * fitter.radius + 1}^2")
+    print(f"  {iterations / elapsed:.1f} iterations/s, loss {fitter.loss:.5f}")
+
+    fitter = GaussianImageFitter(target, num_gaussians=300, capacity=num_gaussians, densify_every=50)
+    start = time.perf_counter()
+    for _ in range(iterations * 3):
+        fitter.step()
+    elapsed = time.perf_counter() - start
+    print(f"  with densification from 300: {fitter.n} Gaussians after {fitter.iteration} "
+          f"iterations ({fitter.iteration / elapsed:.1f} it/s), loss {fitter.loss:.5f}, {fitter.stats}")
+
+
+if __name__ == "__main__":
+    benchmark()
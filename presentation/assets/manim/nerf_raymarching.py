@@ -1,6 +1,27 @@
+import os
+from pathlib import Path
+
 from manim import *
 
-class NeRFRayMarching(Scene):
+from bounded_memory import BoundedMemoryScene
+from components import camera_icon, network_box, photo_frame, pixel_grid
+from gaussian_fit import GaussianImageFitter, disk_target
+from parallel_render import ParallelRenderScene
+from scene_audit import AuditedScene
+from spherical_harmonics import SHEvaluator, random_sh, view_directions
+from tiny_nerf import progressive_renders
+
+
+def image_in_frame(pixels, frame):
+    """RGB floats in [0, 1] (H, W, 3) as an ImageMobject filling ``frame``."""
+    image = ImageMobject(np.uint8(pixels * 255))
+    image.stretch_to_fit_width(frame.width)
+    image.stretch_to_fit_height(frame.height)
+    image.move_to(frame)
+    return image
+
+
+class NeRFRayMarching(AuditedScene, ParallelRenderScene):
     def construct(self):
         # Colors
         BLUE = "#00b3e7"
@@ -18,12 +39,7 @@ class NeRFRayMarching(Scene):
         step1.to_edge(DOWN, buff=0.8)
 
         # Camera body
-        camera_body = RoundedRectangle(
-            width=1.2, height=0.9, corner_radius=0.1,
-            fill_color=GRAY_D, fill_opacity=1, stroke_color=WHITE
-        )
-        camera_lens = Circle(radius=0.25, fill_color=BLUE, fill_opacity=1, stroke_color=WHITE)
-        camera = VGroup(camera_body, camera_lens)
+        camera = camera_icon(lens_color=BLUE)
         camera.move_to(LEFT * 5.5 + DOWN * 0.5)
         camera_label = Text("Camera", font_size=20, color=GRAY_B)
         camera_label.next_to(camera, DOWN, buff=0.2)
@@ -32,12 +48,8 @@ class NeRFRayMarching(Scene):
         self.play(FadeIn(camera), Write(camera_label))
 
         # Image plane (pixel grid)
-        pixel_grid = VGroup()
-        for i in range(4):
-            for j in range(3):
-                rect = Rectangle(width=0.3, height=0.3, stroke_color=GRAY, stroke_width=1)
-                rect.move_to(LEFT * 4 + DOWN * 0.5 + RIGHT * j * 0.3 + UP * i * 0.3 - UP * 0.45)
-                pixel_grid.add(rect)
+        image_plane = pixel_grid(rows=4, cols=3, size=0.3)
+        image_plane.move_to(LEFT * 3.7 + DOWN * 0.5)
 
         # Highlight one pixel
         highlight_pixel = Rectangle(
@@ -48,9 +60,9 @@ class NeRFRayMarching(Scene):
         highlight_pixel.move_to(LEFT * 4 + DOWN * 0.5 + RIGHT * 0.3)
 
         pixel_label = Text("Image", font_size=18, color=GRAY_B)
-        pixel_label.next_to(pixel_grid, DOWN, buff=0.2)
+        pixel_label.next_to(image_plane, DOWN, buff=0.2)
 
-        self.play(FadeIn(pixel_grid), Write(pixel_label))
+        self.play(FadeIn(image_plane), Write(pixel_label))
         self.play(FadeIn(highlight_pixel))
         self.wait(0.5)
 
@@ -110,15 +122,10 @@ class NeRFRayMarching(Scene):
         self.play(Write(step4))
 
         # Neural network box
-        nn_box = RoundedRectangle(
-            width=3, height=1.2, corner_radius=0.15,
-            fill_color="#1a1a2e", fill_opacity=0.9,
-            stroke_color=BLUE, stroke_width=2
-        )
-        nn_box.move_to(UP * 2)
-        nn_title = Text("Neural Network", font_size=20, color=BLUE)
+        network = network_box(3, 1.2, color=BLUE, title_buff=0.35)
+        network.move_to(UP * 2)
+        nn_box, nn_title = network
         nn_subtitle = Text("(x,y,z) + direction → color + density", font_size=14, color=GRAY_B)
-        nn_title.move_to(nn_box.get_center() + UP * 0.25)
         nn_subtitle.move_to(nn_box.get_center() + DOWN * 0.25)
 
         self.play(FadeIn(nn_box), Write(nn_title), Write(nn_subtitle))
@@ -184,7 +191,7 @@ class NeRFRayMarching(Scene):
         self.wait(2)
 
 
-class GaussianSplatting(Scene):
+class GaussianSplatting(AuditedScene, BoundedMemoryScene):
     def construct(self):
         # Colors
         BLUE = "#00b3e7"
@@ -237,6 +244,32 @@ class GaussianSplatting(Scene):
         self.play(Write(label_3d))
         self.wait(0.5)
 
+        # View-dependent color: each blob carries SH coefficients, so its
+        # color shifts as the camera orbits the box
+        sh_coeffs = random_sh(
+            len(gaussians), degree=3,
+            base_colors=[color_to_rgb(c) for c in colors],
+            rng=np.random.default_rng(7)
+        )
+        centers = np.array([g.get_center() for g in gaussians])
+        shade = SHEvaluator(sh_coeffs)
+        orbit = ValueTracker(0)
+
+        def shade_gaussians(group):
+            angle = orbit.get_value()
+            eye = box.get_center() + 6 * np.array([np.sin(angle), 0.3, np.cos(angle)])
+            rgb = shade(view_directions(centers, eye))
+            for g, c in zip(group, rgb):
+                g.set_fill(rgb_to_color(c))
+
+        sh_label = Text("Color changes with viewing angle", font_size=18, color=GRAY_B)
+        sh_label.next_to(box, RIGHT, buff=0.5)
+        gaussians.add_updater(shade_gaussians)
+        self.play(Write(sh_label))
+        self.play(orbit.animate.set_value(2 * PI), run_time=3, rate_func=linear)
+        gaussians.remove_updater(shade_gaussians)
+        self.play(FadeOut(sh_label))
+
         # Step 2: Project
         self.play(FadeOut(step1))
         step2 = Text("Step 2: Project onto screen (GPU rasterization)", font_size=28, color=WHITE)
@@ -300,7 +333,7 @@ class GaussianSplatting(Scene):
         self.wait(2)
 
 
-class NeRFTraining(Scene):
+class NeRFTraining(AuditedScene, ParallelRenderScene):
     """Explains how NeRF's neural network learns from photos"""
     def construct(self):
         BLUE = "#00b3e7"
@@ -326,13 +359,10 @@ class NeRFTraining(Scene):
             LEFT * 2 + DOWN * 1.5,
         ]
 
-        for i, pos in enumerate(photo_positions):
-            photo = Rectangle(width=1.2, height=0.9, fill_color=GRAY_D, fill_opacity=0.8, stroke_color=WHITE)
+        for pos in photo_positions:
+            photo = photo_frame(icon_color=BLUE)
             photo.move_to(pos)
-            # Add a simple icon inside
-            icon = Square(side_length=0.3, fill_color=BLUE, fill_opacity=0.7, stroke_width=0)
-            icon.move_to(pos)
-            photos.add(VGroup(photo, icon))
+            photos.add(photo)
 
         self.play(LaggedStart(*[FadeIn(p) for p in photos], lag_ratio=0.2))
 
@@ -348,15 +378,9 @@ class NeRFTraining(Scene):
         self.play(Write(step2))
 
         # Neural network diagram
-        nn_box = RoundedRectangle(
-            width=3.5, height=2, corner_radius=0.15,
-            fill_color="#1a1a2e", fill_opacity=0.9,
-            stroke_color=BLUE, stroke_width=2
-        )
-        nn_box.move_to(RIGHT * 0.5)
-
-        nn_title = Text("Neural Network", font_size=20, color=BLUE)
-        nn_title.move_to(nn_box.get_top() + DOWN * 0.4)
+        network = network_box(3.5, 2, color=BLUE)
+        network.move_to(RIGHT * 0.5)
+        nn_box, nn_title = network
 
         # Input/output labels
         input_text = Text("(x,y,z,θ,φ)", font_size=16, color=GRAY_B)
@@ -377,22 +401,43 @@ class NeRFTraining(Scene):
         step3.to_edge(DOWN, buff=0.8)
         self.play(Write(step3))
 
-        # Show rendered vs real comparison
+        # Show rendered vs real comparison: a tiny hash-grid NeRF really
+        # trained on a synthetic scene (cached under media/cache)
+        target, snapshots = progressive_renders(
+            iterations=500, snapshot_at=[0, 25, 75, 200, 500],
+            cache_dir=Path(config.get_dir("media_dir")) / "cache",
+            workers=os.cpu_count() or 1
+        )
+
+        def nerf_caption(snapshot):
+            caption = Text(
+                f"Iteration {snapshot['iteration']}\nPSNR {snapshot['psnr']:.1f} dB",
+                font_size=12, color=GRAY_B
+            )
+            caption.next_to(rendered_frame, RIGHT, buff=0.15)
+            return caption
+
         rendered_frame = Rectangle(width=1.4, height=1.0, stroke_color=TURQUOISE, stroke_width=2)
         rendered_frame.move_to(RIGHT * 4 + UP * 0.8)
         rendered_label = Text("NeRF renders", font_size=14, color=TURQUOISE)
         rendered_label.next_to(rendered_frame, UP, buff=0.15)
+        rendered_image = image_in_frame(snapshots[0]["image"], rendered_frame)
+        rendered_text = nerf_caption(snapshots[0])
 
         real_frame = Rectangle(width=1.4, height=1.0, stroke_color=GREEN, stroke_width=2)
         real_frame.move_to(RIGHT * 4 + DOWN * 0.8)
         real_label = Text("Real photo", font_size=14, color=GREEN)
         real_label.next_to(real_frame, DOWN, buff=0.15)
+        real_image = image_in_frame(target, real_frame)
 
         # Arrow from network to rendered
         render_arrow = Arrow(nn_box.get_right(), rendered_frame.get_left(), color=TURQUOISE, stroke_width=2)
 
-        self.play(Create(render_arrow), FadeIn(rendered_frame), Write(rendered_label))
-        self.play(FadeIn(real_frame), Write(real_label))
+        self.play(
+            Create(render_arrow), FadeIn(rendered_image), FadeIn(rendered_frame),
+            Write(rendered_label), FadeIn(rendered_text)
+        )
+        self.play(FadeIn(real_image), FadeIn(real_frame), Write(real_label))
 
         # Compare arrow
         compare_arrow = DoubleArrow(
@@ -424,12 +469,14 @@ class NeRFTraining(Scene):
         step4.to_edge(DOWN, buff=0.8)
         self.play(Write(step4))
 
-        # Animate improvement
-        for _ in range(3):
+        # Animate improvement with the renders saved during training
+        for snapshot in snapshots[1:]:
             self.play(
                 nn_box.animate.set_stroke(TURQUOISE, width=3),
                 compare_arrow.animate.set_color(YELLOW),
-                run_time=0.3
+                Transform(rendered_image, image_in_frame(snapshot["image"], rendered_frame)),
+                Transform(rendered_text, nerf_caption(snapshot)),
+                run_time=0.5
             )
             self.play(
                 nn_box.animate.set_stroke(BLUE, width=2),
@@ -455,7 +502,7 @@ class NeRFTraining(Scene):
         self.wait(2)
 
 
-class GaussianSplattingTraining(Scene):
+class GaussianSplattingTraining(AuditedScene, BoundedMemoryScene):
     """Explains how 3D Gaussians are optimized during training - CLEAR VERSION"""
     def construct(self):
         BLUE = "#00b3e7"
@@ -518,10 +565,11 @@ class GaussianSplattingTraining(Scene):
         step2.to_edge(DOWN, buff=0.8)
         self.play(Write(step2))
 
-        # Show photos
-        photo1 = Rectangle(width=1.5, height=1.1, fill_color=GRAY_D, fill_opacity=0.8, stroke_color=WHITE)
-        photo2 = photo1.copy()
-        photo3 = photo1.copy()
+        # Show photos, each with a simple object icon
+        photo1, photo2, photo3 = [
+            photo_frame(1.5, 1.1, icon="circle", icon_size=0.2, icon_color=BLUE, icon_opacity=0.5)
+            for _ in range(3)
+        ]
         photo1.move_to(LEFT * 5 + UP * 1)
         photo2.move_to(LEFT * 5)
         photo3.move_to(LEFT * 5 + DOWN * 1)
@@ -529,12 +577,6 @@ class GaussianSplattingTraining(Scene):
         photo_label = Text("Your photos", font_size=16, color=GRAY_B)
         photo_label.next_to(photo2, LEFT, buff=0.3)
 
-        # Simple object icon in each photo
-        for p in [photo1, photo2, photo3]:
-            icon = Circle(radius=0.2, fill_color=BLUE, fill_opacity=0.5, stroke_width=0)
-            icon.move_to(p.get_center())
-            p.add(icon)
-
         self.play(FadeIn(photo1), FadeIn(photo2), FadeIn(photo3), Write(photo_label))
 
         # Arrow to COLMAP
@@ -625,18 +667,33 @@ class GaussianSplattingTraining(Scene):
         rendered_label = Text("What Gaussians render", font_size=14, color=TURQUOISE)
         rendered_label.next_to(rendered_frame, UP, buff=0.15)
 
-        # Add some blurry blobs inside to show it's rough
-        rendered_blobs = VGroup()
-        for i in range(4):
-            b = Ellipse(width=0.4, height=0.3, fill_color=colors[i], fill_opacity=0.4, stroke_width=0)
-            b.move_to(rendered_frame.get_center() + np.array([
-                (np.random.rand() - 0.5) * 1.2,
-                (np.random.rand() - 0.5) * 0.8,
-                0
-            ]))
-            rendered_blobs.add(b)
+        # Fit real 2D Gaussians to a 64x48 version of the "actual photo"
+        # below (32 px per unit) and keep snapshots of the optimization
+        photo_bg = color_to_rgb(GRAY_E) * 0.3
+        target = disk_target(
+            64, 48, center=(32, 24), radius=12.8,
+            color=color_to_rgb(BLUE) * 0.8 + photo_bg * 0.2,
+            background=photo_bg, rim_color=(1, 1, 1)
+        )
+        fitter = GaussianImageFitter(target, num_gaussians=40, capacity=1500, densify_every=25)
+        snapshots = list(fitter.run(200, snapshot_at=[0, 10, 30, 80, 100, 200]))
+        # Iteration 100 densifies (every 25): shown step by step in part 6
+        densify_snapshot = snapshots[4]
+
+        def fit_caption(snapshot):
+            caption = Text(
+                f"Iteration {snapshot['iteration']} · {snapshot['count']} Gaussians · "
+                f"loss {snapshot['loss']:.4f}",
+                font_size=12, color=GRAY_B
+            )
+            caption.next_to(rendered_frame, DOWN, buff=0.15)
+            return caption
+
+        # First render from the initial Gaussians is rough
+        rendered_blobs = image_in_frame(snapshots[0]["image"], rendered_frame)
+        fit_text = fit_caption(snapshots[0])
 
-        self.play(FadeIn(rendered_frame), Write(rendered_label), FadeIn(rendered_blobs))
+        self.play(FadeIn(rendered_frame), Write(rendered_label), FadeIn(rendered_blobs), FadeIn(fit_text))
 
         # Real photo (sharp)
         real_frame = Rectangle(width=2, height=1.5, stroke_color=GREEN, stroke_width=2, fill_color=GRAY_E, fill_opacity=0.3)
@@ -656,7 +713,7 @@ class GaussianSplattingTraining(Scene):
         self.play(Write(vs_text))
 
         loss_text = Text("LOSS = How different are they?", font_size=18, color=RED)
-        loss_text.move_to(RIGHT * 3.5 + DOWN * 1.2)
+        loss_text.move_to(RIGHT * 3.5 + DOWN * 1.6)
         self.play(Write(loss_text))
         self.wait(0.5)
 
@@ -677,18 +734,18 @@ class GaussianSplattingTraining(Scene):
 
         self.play(Create(adjust_arrow), Write(adjust_text))
 
-        # Animate Gaussians adjusting
-        for _ in range(2):
+        # Play back the optimization: each snapshot is a real iteration
+        for snapshot in snapshots[1:]:
             self.play(
-                *[g.animate.shift(np.array([np.random.rand()*0.1-0.05, np.random.rand()*0.1-0.05, 0]))
-                  for g in init_gaussians],
-                run_time=0.3
+                Transform(rendered_blobs, image_in_frame(snapshot["image"], rendered_frame)),
+                Transform(fit_text, fit_caption(snapshot)),
+                run_time=0.6
             )
         self.wait(0.3)
 
         # Clear for densification explanation
         self.play(
-            FadeOut(rendered_frame), FadeOut(rendered_label), FadeOut(rendered_blobs),
+            FadeOut(rendered_frame), FadeOut(rendered_label), FadeOut(rendered_blobs), FadeOut(fit_text),
             FadeOut(real_frame), FadeOut(real_label), FadeOut(real_object),
             FadeOut(render_arrow), FadeOut(render_text),
             FadeOut(vs_text), FadeOut(loss_text),
@@ -702,76 +759,119 @@ class GaussianSplattingTraining(Scene):
         step6.to_edge(DOWN, buff=0.8)
         self.play(Write(step6))
 
+        # One real densification step of the fit above, drawn Gaussian by
+        # Gaussian: the panel is the 64x48 training image, +-2 sigma ellipses
+        densify = densify_snapshot["densify"]
+        before, after = densify["before"], densify_snapshot
+        count, moved_to = densify["count"], densify["moved_to"]
+        split, cloned = densify["split"], densify["cloned"]
+
+        panel = Rectangle(width=3.2, height=2.4, stroke_color=TURQUOISE, stroke_width=2, fill_color=GRAY_E, fill_opacity=0.3)
+        panel.move_to(DOWN * 1.2)
+
+        def gaussian_ellipses(state):
+            unit = panel.width / fitter.width
+            ellipses = VGroup()
+            for (x, y), (sx, sy), angle, color, opacity in zip(
+                state["means"], state["scales"], state["angles"], state["colors"], state["opacities"]
+            ):
+                g = Ellipse(
+                    width=4 * sx * unit, height=4 * sy * unit,
+                    fill_color=rgb_to_color(color), fill_opacity=0.3 + 0.6 * float(opacity),
+                    stroke_width=0
+                )
+                g.rotate(-angle)
+                g.move_to(panel.get_corner(UL) + RIGHT * x * unit + DOWN * y * unit)
+                ellipses.add(g)
+            return ellipses
+
+        before_blobs = gaussian_ellipses(before)
+        after_blobs = gaussian_ellipses(after)
+        densify_text = Text(f"Iteration {densify['iteration']} · {count} Gaussians", font_size=14, color=GRAY_B)
+        densify_text.next_to(panel, RIGHT, buff=0.3)
+
+        self.play(FadeIn(panel), FadeIn(before_blobs), FadeIn(densify_text))
+        on_screen = list(before_blobs)
+
         # --- SPLIT ---
         split_title = Text("SPLIT", font_size=36, color=RED, weight=BOLD)
         split_title.move_to(UP * 1)
         split_desc = Text("Gaussian too big → divide into smaller ones", font_size=22, color=WHITE)
         split_desc.next_to(split_title, DOWN, buff=0.3)
-
-        big_gauss = Ellipse(width=1.8, height=1.2, fill_color=RED, fill_opacity=0.6, stroke_width=0)
-        big_gauss.move_to(DOWN * 1)
-
-        self.play(Write(split_title), Write(split_desc), GrowFromCenter(big_gauss))
-        self.wait(0.3)
-
-        # Split animation
-        small1 = Ellipse(width=0.9, height=0.6, fill_color=RED, fill_opacity=0.6, stroke_width=0)
-        small2 = small1.copy()
-        small1.move_to(LEFT * 1.2 + DOWN * 1)
-        small2.move_to(RIGHT * 1.2 + DOWN * 1)
-
-        self.play(
-            ReplacementTransform(big_gauss, VGroup(small1, small2)),
-            run_time=0.8
-        )
+        self.play(Write(split_title), Write(split_desc))
+
+        if len(split):
+            self.play(*[before_blobs[i].animate.set_stroke(RED, 2) for i in split], run_time=0.5)
+            splits = []
+            for k, i in enumerate(split):
+                children = [after_blobs[j] for j in (moved_to[i], moved_to[count + k]) if j >= 0]
+                splits.append(ReplacementTransform(before_blobs[i], VGroup(*children)))
+                on_screen.remove(before_blobs[i])
+                on_screen.extend(children)
+            self.play(*splits, run_time=0.8)
         self.wait(0.5)
 
         # Clear SPLIT
-        self.play(FadeOut(split_title), FadeOut(split_desc), FadeOut(small1), FadeOut(small2))
+        self.play(FadeOut(split_title), FadeOut(split_desc))
 
         # --- CLONE ---
         clone_title = Text("CLONE", font_size=36, color=BLUE, weight=BOLD)
         clone_title.move_to(UP * 1)
         clone_desc = Text("Area needs more detail → duplicate Gaussian", font_size=22, color=WHITE)
         clone_desc.next_to(clone_title, DOWN, buff=0.3)
-
-        small_gauss = Ellipse(width=0.8, height=0.6, fill_color=BLUE, fill_opacity=0.6, stroke_width=0)
-        small_gauss.move_to(LEFT * 0.8 + DOWN * 1)
-
-        self.play(Write(clone_title), Write(clone_desc), GrowFromCenter(small_gauss))
-        self.wait(0.3)
-
-        # Clone animation
-        clone_copy = small_gauss.copy()
-        clone_copy.move_to(RIGHT * 0.8 + DOWN * 0.8)
-
-        self.play(TransformFromCopy(small_gauss, clone_copy), run_time=0.8)
+        self.play(Write(clone_title), Write(clone_desc))
+
+        if len(cloned):
+            self.play(*[before_blobs[i].animate.set_stroke(BLUE, 2) for i in cloned], run_time=0.5)
+            copies = [
+                (before_blobs[i], after_blobs[moved_to[count + len(split) + k]])
+                for k, i in enumerate(cloned) if moved_to[count + len(split) + k] >= 0
+            ]
+            self.play(*[TransformFromCopy(source, copy) for source, copy in copies], run_time=0.8)
+            on_screen.extend(copy for _, copy in copies)
+            self.play(*[before_blobs[i].animate.set_stroke(width=0) for i in cloned], run_time=0.3)
         self.wait(0.5)
 
         # Clear CLONE
-        self.play(FadeOut(clone_title), FadeOut(clone_desc), FadeOut(small_gauss), FadeOut(clone_copy))
+        self.play(FadeOut(clone_title), FadeOut(clone_desc))
 
         # --- PRUNE ---
         prune_title = Text("PRUNE", font_size=36, color=GRAY_B, weight=BOLD)
         prune_title.move_to(UP * 1)
         prune_desc = Text("Gaussian nearly invisible → remove it", font_size=22, color=WHITE)
         prune_desc.next_to(prune_title, DOWN, buff=0.3)
-
-        ghost_gauss = Ellipse(width=0.8, height=0.6, fill_color=GRAY, fill_opacity=0.15, stroke_width=2, stroke_color=GRAY)
-        ghost_gauss.move_to(DOWN * 1)
-
-        self.play(Write(prune_title), Write(prune_desc), FadeIn(ghost_gauss))
+        self.play(Write(prune_title), Write(prune_desc))
+
+        pruned = [before_blobs[i] for i in range(count) if moved_to[i] < 0]
+        if pruned:
+            self.play(*[g.animate.set_stroke(GRAY, 2) for g in pruned], run_time=0.5)
+            self.play(*[FadeOut(g) for g in pruned], run_time=0.5)
+            for g in pruned:
+                on_screen.remove(g)
+        else:
+            # Nothing is faint enough yet this early in training
+            faintest = int(np.argmin(before["opacities"]))
+            prune_note = Text(
+                f"Faintest opacity {before['opacities'][faintest]:.2f} > {fitter.prune_opacity} → kept",
+                font_size=14, color=GRAY_B
+            )
+            prune_note.next_to(densify_text, DOWN, buff=0.2, aligned_edge=LEFT)
+            self.play(Indicate(before_blobs[faintest], color=GRAY_B), Write(prune_note))
+            self.play(FadeOut(prune_note))
         self.wait(0.3)
 
-        # Prune animation
-        x_mark = Text("✗", font_size=48, color=RED)
-        x_mark.move_to(ghost_gauss)
-        self.play(Write(x_mark))
-        self.play(FadeOut(ghost_gauss), FadeOut(x_mark), run_time=0.5)
-        self.wait(0.3)
+        self.play(Transform(densify_text, Text(
+            f"Iteration {densify['iteration']} · {count} → {after['count']} Gaussians\n"
+            f"split {len(split)}, cloned {len(cloned)}, pruned {densify['pruned']}",
+            font_size=14, color=GRAY_B
+        ).next_to(panel, RIGHT, buff=0.3)))
+        self.wait(0.5)
 
-        # Clear PRUNE
-        self.play(FadeOut(prune_title), FadeOut(prune_desc))
+        # Clear PRUNE and the densification panel
+        self.play(
+            FadeOut(prune_title), FadeOut(prune_desc),
+            FadeOut(panel), FadeOut(densify_text), *[FadeOut(g) for g in on_screen],
+        )
 
         # ============ PART 7: Final result ============
         self.play(FadeOut(step6))
@@ -0,0 +1,325 @@
+"""Rasterize the frames of one play() on a pool of threads.
+
+Manim renders an animation strictly frame by frame: interpolate every
+animation to time t, rasterize, hand the frame to the encoder, repeat.
+Without updaters, an animation's state at frame k depends only on
+alpha = t_k / run_time. ParallelRenderScene therefore gives each worker
+thread a private deep copy of the animations and moving mobjects and a
+private camera. Each worker computes the state for its own frames on
+demand, rasterizes them, and drops them into a reorder buffer. The main
+thread drains the buffer in frame order into the file writer, so the
+output matches serial rendering frame for frame.
+
+Workers take frames round-robin, so each one only moves forward in time
+(Succession and other stateful groups advance correctly). A worker may
+run at most ``render_window`` frames ahead of the writer, which bounds
+the frames held in memory. Cairo releases the GIL while it fills and
+strokes, so the pool scales with the fraction of a frame spent inside
+Cairo; Python-side interpolation stays serialized.
+
+Threading is opt-in: a scene renders serially unless ``render_threads``
+or MANIM_RENDER_THREADS asks for more than one thread (the class
+attribute wins). Plays with updaters, a stop condition, or fewer than
+``min_parallel_frames`` frames fall back to the serial path regardless.
+
+Scaling and frame-for-frame comparison against serial rendering:
+    python parallel_render.py
+"""
+
+import copy
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from manim import *
+
+
+def default_thread_count():
+    """MANIM_RENDER_THREADS, or 1 (serial) when it is not set."""
+    return int(os.environ.get("MANIM_RENDER_THREADS", 0)) or 1
+
+
+class ReorderBuffer:
+    """Frames finished out of order, handed to a single consumer in order.
+
+    Producers block in ``wait_for_slot`` while their frame is ``capacity``
+    or more frames ahead of the next one to be consumed.
+    """
+
+    def __init__(self, capacity):
+        self.window = capacity
+        self.capacity = capacity
+        self.frames = {}
+        self.next_index = 0
+        self.error = None
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def throttle(self, enabled):
+        """Let producers run only one frame ahead while ``enabled``."""
+        with self.condition:
+            self.capacity = 1 if enabled else self.window
+            self.condition.notify_all()
+
+    def wait_for_slot(self, index):
+        """False if the buffer was closed while waiting."""
+        with self.condition:
+            while index >= self.next_index + self.capacity and not self.closed:
+                self.condition.wait()
+            return not self.closed
+
+    def put(self, index, item):
+        with self.condition:
+            self.frames[index] = item
+            self.condition.notify_all()
+
+    def fail(self, error):
+        with self.condition:
+            self.error = error
+            self.condition.notify_all()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def pop(self):
+        """Next frame in order; re-raises a worker's exception."""
+        with self.condition:
+            while self.next_index not in self.frames and self.error is None:
+                self.condition.wait()
+            if self.error is not None:
+                raise self.error
+            item = self.frames.pop(self.next_index)
+            self.next_index += 1
+            self.condition.notify_all()
+            return item
+
+
+class FrameWorker:
+    """A private copy of one play's moving state plus its own camera."""
+
+    def __init__(self, scene, animations, moving_mobjects):
+        # Succession keeps the scene to add its later animations to it;
+        # copies must leave the scene alone, so they get None instead
+        memo = {id(scene): None}
+        self.animations = copy.deepcopy(animations, memo)
+        # Mobjects that are not part of any animation (drawn above one)
+        # are copied through the same memo, so shared children stay shared
+        self.moving_mobjects = copy.deepcopy(moving_mobjects, memo)
+        self.static_image = scene.renderer.static_image
+
+        camera = scene.renderer.camera
+        self.camera = copy.copy(camera)
+        self.camera.pixel_array = camera.pixel_array.copy()
+        self.camera.pixel_array_to_cairo_context = {}
+        # AuditingCamera keeps per-frame stats; collect them per worker
+        # and merge them back in frame order
+        if hasattr(camera, "frame_stats"):
+            self.camera.frame_stats = []
+
+    def render(self, t, frame=None):
+        """Rasterize time ``t`` into ``frame``, or into a fresh copy if None."""
+        for animation in self.animations:
+            animation.interpolate(t / animation.run_time)
+
+        camera = self.camera
+        own = camera.pixel_array
+        if frame is not None:
+            camera.pixel_array = frame
+        try:
+            if self.static_image is not None:
+                camera.set_frame_to_background(self.static_image)
+            else:
+                camera.reset()
+            camera.capture_mobjects(self.moving_mobjects, include_submobjects=True)
+        finally:
+            camera.pixel_array = own
+
+        stats = camera.frame_stats.pop() if getattr(camera, "frame_stats", None) else None
+        return (own.copy() if frame is None else frame), stats
+
+
+class ParallelRenderScene(Scene):
+    """Scene whose plays are rasterized by a thread pool (Cairo renderer)."""
+
+    render_threads = None
+    render_window = None
+    min_parallel_frames = 12
+    reorder_buffer = None
+
+    def parallel_blocker(self, skip_rendering):
+        """Why the current play must be rendered serially, or None."""
+        threads = self.render_threads or default_thread_count()
+        if threads <= 1:
+            return "one thread"
+        if skip_rendering or self.skip_animation_preview or self.renderer.skip_animations:
+            return "not rendering"
+        if not hasattr(self.renderer, "static_image"):
+            return "not the Cairo renderer"
+        if self.stop_condition is not None:
+            return "stop condition"
+        if not self.moving_mobjects:
+            return "nothing moves"
+        if self.updaters:
+            return "scene updaters"
+        for mobject in self.get_mobject_family_members():
+            if mobject.updaters:
+                return "mobject updaters"
+        for animation in self.animations:
+            if any(m.updaters for m in animation.mobject.get_family()):
+                return "mobject updaters"
+        if self.duration * config.frame_rate < self.min_parallel_frames:
+            return "too few frames"
+        return None
+
+    def frame_window(self, threads):
+        """How many frames workers may run ahead of the writer."""
+        return max(self.render_window or 2 * threads, threads)
+
+    def acquire_frame(self):
+        """Buffer a worker rasterizes its next frame into (None: a fresh copy).
+
+        Called from worker threads.
+        """
+        return None
+
+    def release_frame(self, frame):
+        """Take back a frame from ``acquire_frame`` that will not be written."""
+
+    def write_frame(self, frame):
+        """Hand a finished frame to the file writer, in frame order."""
+        self.renderer.add_frame(frame)
+
+    def play_internal(self, skip_rendering=False):
+        if self.parallel_blocker(skip_rendering) is not None:
+            return super().play_internal(skip_rendering)
+
+        self.duration = self.get_run_time(self.animations)
+        self.time_progression = self._get_animation_time_progression(self.animations, self.duration)
+        times = list(self.time_progression.iterable)
+
+        self.render_frames_parallel(times)
+
+        # Leave the scene exactly as the serial loop would, then finish
+        self.update_to_time(times[-1])
+        for animation in self.animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        if not self.renderer.skip_animations:
+            self.update_mobjects(0)
+        self.renderer.static_image = None
+        self.time_progression.close()
+
+    def render_frames_parallel(self, times):
+        threads = min(self.render_threads or default_thread_count(), len(times))
+        window = self.frame_window(threads)
+        renderer = self.renderer
+        camera = renderer.camera
+        workers = [
+            FrameWorker(self, self.animations, self.moving_mobjects)
+            for _ in range(threads)
+        ]
+        buffer = self.reorder_buffer = ReorderBuffer(window)
+
+        def run(worker_index):
+            worker = workers[worker_index]
+            try:
+                for index in range(worker_index, len(times), threads):
+                    if not buffer.wait_for_slot(index):
+                        return
+                    frame = self.acquire_frame()
+                    try:
+                        rendered = worker.render(times[index], frame)
+                    except BaseException:
+                        if frame is not None:
+                            self.release_frame(frame)
+                        raise
+                    buffer.put(index, rendered)
+            except BaseException as error:
+                buffer.fail(error)
+
+        with ThreadPoolExecutor(threads, thread_name_prefix="frame") as pool:
+            futures = [pool.submit(run, i) for i in range(threads)]
+            try:
+                for _ in times:
+                    frame, stats = buffer.pop()
+                    if stats is not None:
+                        camera.frame_stats.append(stats)
+                    self.write_frame(frame)
+                    self.time_progression.update(1)
+            finally:
+                buffer.close()
+                for future in futures:
+                    future.result()
+                # Frames finished after a failure are never written
+                for frame, _ in buffer.frames.values():
+                    self.release_frame(frame)
+                self.reorder_buffer = None
+
+
+# Benchmark
+
+class ScalingBenchmark(ParallelRenderScene):
+    """The two long animations from the Gaussian scenes: a LaggedStart of
+    30 ellipses and a TransformFromCopy projection."""
+
+    def construct(self):
+        rng = np.random.default_rng(0)
+        colors = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE]
+        gaussians = VGroup()
+        for i in range(30):
+            g = Ellipse(
+                width=0.15 + rng.random() * 0.25,
+                height=0.1 + rng.random() * 0.15,
+                fill_color=colors[i % len(colors)],
+                fill_opacity=0.4 + rng.random() * 0.4,
+                stroke_width=0
+            )
+            g.move_to(np.array([(rng.random() - 0.5) * 4, (rng.random() - 0.5) * 2, 0]))
+            g.rotate(rng.random() * PI / 2)
+            gaussians.add(g)
+        self.play(LaggedStart(*[GrowFromCenter(g) for g in gaussians], lag_ratio=0.03), run_time=1.5)
+
+        projected = VGroup(*[g.copy().scale(0.9).shift(RIGHT * 3) for g in gaussians])
+        self.play(*[TransformFromCopy(g, p) for g, p in zip(gaussians, projected)], run_time=1.5)
+
+
+def benchmark(thread_counts=(1, 2, 4, 8), quality="high_quality", scene_cls=ScalingBenchmark):
+    """Render ``scene_cls`` with each thread count and compare frame hashes."""
+    results = []
+    for threads in thread_counts:
+        hashes = []
+        with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+            "quality": quality, "media_dir": media_dir,
+            "disable_caching": True, "progress_bar": "none", "verbosity": "WARNING",
+        }):
+            scene = scene_cls()
+            scene.render_threads = threads
+            add_frame = scene.renderer.add_frame
+
+            def hashing_add_frame(frame, num_frames=1):
+                hashes.append(hashlib.sha1(frame.tobytes()).hexdigest())
+                add_frame(frame, num_frames)
+
+            scene.renderer.add_frame = hashing_add_frame
+            start = time.perf_counter()
+            scene.render()
+            elapsed = time.perf_counter() - start
+        results.append((threads, len(hashes), elapsed, hashes))
+
+    serial = results[0]
+    print(f"{scene_cls.__name__} at {quality}, {os.cpu_count()} CPUs")
+    print(f"{'threads':>8}{'frames':>8}{'seconds':>10}{'fps':>8}{'speedup':>9}  identical to {serial[0]} thread(s)")
+    for threads, frames, elapsed, hashes in results:
+        print(f"{threads:>8}{frames:>8}{elapsed:>10.2f}{frames / elapsed:>8.1f}"
+              f"{serial[2] / elapsed:>9.2f}  {hashes == serial[3]}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
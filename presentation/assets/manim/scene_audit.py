@@ -0,0 +1,197 @@
+"""Scene-graph lifecycle auditing for the thesis scenes.
+
+Every mobject left in a scene is traversed and rasterized on every frame,
+even when it has faded to opacity 0 or been moved out of frame.
+AuditingCamera drops such leaves before they reach Cairo and records
+what each frame cost. AuditedScene logs a per-play table at the end of
+the render (frames, mobjects in the scene, leaves drawn and culled,
+milliseconds per frame) and writes the full per-frame timeline to
+media/audit/<Scene>.json.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from manim.mobject.types.image_mobject import AbstractImageMobject
+
+from units import STROKE_WIDTH_SCALE
+
+
+def effective_opacity(mobject):
+    """Highest opacity any part of a leaf mobject is drawn with."""
+    if isinstance(mobject, VMobject):
+        opacity = float(np.max(mobject.get_fill_opacities(), initial=0))
+        if mobject.get_stroke_width() > 0:
+            opacity = max(opacity, float(np.max(mobject.get_stroke_opacities(), initial=0)))
+        if mobject.get_stroke_width(background=True) > 0:
+            opacity = max(opacity, float(np.max(mobject.get_stroke_opacities(background=True), initial=0)))
+        return opacity
+    if isinstance(mobject, PMobject):
+        return float(np.max(mobject.rgbas[:, 3], initial=0))
+    if isinstance(mobject, AbstractImageMobject):
+        return float(getattr(mobject, "stroke_opacity", 1.0))
+    return 1.0
+
+
+def bounds(mobject):
+    """(min, max) corners of a leaf's points, padded by its stroke width."""
+    points = mobject.points
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    if isinstance(mobject, VMobject):
+        pad = max(mobject.get_stroke_width(), mobject.get_stroke_width(background=True))
+        pad *= STROKE_WIDTH_SCALE / 2
+        low = low - pad
+        high = high + pad
+    return low, high
+
+
+class AuditingCamera(Camera):
+    """Camera that skips invisible leaves and times each capture."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cull = True
+        self.recording = False
+        self.frame_stats = []
+        self._counts = None
+
+    def is_visible(self, mobject):
+        """Returns (visible, reason) for a leaf mobject."""
+        if effective_opacity(mobject) <= 0:
+            return False, "transparent"
+        if isinstance(mobject, AbstractImageMobject):
+            # Images are drawn from their corners, which may be rotated
+            return self.is_in_frame(mobject), "offscreen"
+
+        low, high = bounds(mobject)
+        fc = self.frame_center
+        half_w = self.frame_width / 2
+        half_h = self.frame_height / 2
+        inside = (
+            high[0] >= fc[0] - half_w and low[0] <= fc[0] + half_w
+            and high[1] >= fc[1] - half_h and low[1] <= fc[1] + half_h
+        )
+        return inside, "offscreen"
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = super().get_mobjects_to_display(*args, **kwargs)
+        counts = {"drawn": 0, "transparent": 0, "offscreen": 0, "points": 0}
+        if not self.cull:
+            counts["drawn"] = len(mobjects)
+            counts["points"] = sum(len(m.points) for m in mobjects)
+            self._counts = counts
+            return mobjects
+
+        kept = []
+        for mobject in mobjects:
+            visible, reason = self.is_visible(mobject)
+            if visible:
+                kept.append(mobject)
+                counts["points"] += len(mobject.points)
+            else:
+                counts[reason] += 1
+        counts["drawn"] = len(kept)
+        self._counts = counts
+        return kept
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        start = time.perf_counter()
+        super().capture_mobjects(mobjects, **kwargs)
+        if self.recording and self._counts is not None:
+            stats = dict(self._counts)
+            stats["ms"] = (time.perf_counter() - start) * 1000
+            self.frame_stats.append(stats)
+        self._counts = None
+
+
+class AuditedScene(Scene):
+    """Scene rendered through an AuditingCamera, with a report at the end."""
+
+    cull_invisible = True
+    write_audit_report = True
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("camera_class", AuditingCamera)
+        super().__init__(*args, **kwargs)
+        self.audit = []
+
+    def play_internal(self, skip_rendering=False):
+        camera = self.renderer.camera
+        if not isinstance(camera, AuditingCamera):
+            return super().play_internal(skip_rendering)
+
+        camera.cull = self.cull_invisible
+        camera.recording = True
+        first = len(camera.frame_stats)
+        start = self.renderer.time
+        try:
+            super().play_internal(skip_rendering)
+        finally:
+            camera.recording = False
+
+        frames = camera.frame_stats[first:]
+        self.audit.append({
+            "play": self.renderer.num_plays,
+            "t": round(start, 4),
+            "animations": ", ".join(str(a) for a in self.animations)[:80],
+            "mobjects": len(self.get_mobject_family_members()),
+            "frames": [
+                {key: round(value, 3) if key == "ms" else value for key, value in stats.items()}
+                for stats in frames
+            ],
+        })
+
+    def tear_down(self):
+        super().tear_down()
+        if self.audit:
+            self.report_audit()
+
+    def audit_summary(self):
+        rows = []
+        for entry in self.audit:
+            frames = entry["frames"]
+            n = max(len(frames), 1)
+            rows.append({
+                "play": entry["play"],
+                "frames": len(frames),
+                "mobjects": entry["mobjects"],
+                "drawn": sum(f["drawn"] for f in frames) / n,
+                "transparent": sum(f["transparent"] for f in frames) / n,
+                "offscreen": sum(f["offscreen"] for f in frames) / n,
+                "ms": sum(f["ms"] for f in frames) / n,
+            })
+        return rows
+
+    def report_audit(self):
+        rows = self.audit_summary()
+        total_frames = sum(r["frames"] for r in rows)
+        total_ms = sum(r["ms"] * r["frames"] for r in rows)
+        culled = sum((r["transparent"] + r["offscreen"]) * r["frames"] for r in rows)
+
+        lines = [
+            f"Audit {type(self).__name__}: {len(rows)} plays, {total_frames} frames, "
+            f"{total_ms / 1000:.1f} s rasterizing, {culled:.0f} leaf draws culled",
+            f"{'play':>6}{'frames':>8}{'mobjects':>10}{'drawn':>8}{'transparent':>13}{'offscreen':>11}{'ms/frame':>10}",
+        ]
+        for r in rows:
+            lines.append(
+                f"{r['play']:>6}{r['frames']:>8}{r['mobjects']:>10}{r['drawn']:>8.0f}"
+                f"{r['transparent']:>13.0f}{r['offscreen']:>11.0f}{r['ms']:>10.2f}"
+            )
+        logger.info("\n".join(lines))
+
+        if self.write_audit_report:
+            out_dir = Path(config.get_dir("media_dir")) / "audit"
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path = out_dir / f"{type(self).__name__}.json"
+            path.write_text(json.dumps({
+                "scene": type(self).__name__,
+                "cull_invisible": self.cull_invisible,
+                "summary": rows,
+                "plays": self.audit,
+            }, indent=1))
+            logger.info(f"Audit timeline written to {path}")
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The scene modules import each other as top-level modules (manim is run
+# from presentation/assets/manim), so tests need that directory on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
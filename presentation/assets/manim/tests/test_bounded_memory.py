@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+pytest.importorskip("cairo")
+manim = pytest.importorskip("manim")
+
+import bounded_memory
+from bounded_memory import BoundedMemoryScene
+
+
+class FailingCamera(manim.Camera):
+    """Raises on the ``fail_at``-th frame it rasterizes (None: never)."""
+
+    fail_at = None
+    captures = 0
+    lock = threading.Lock()
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        with FailingCamera.lock:
+            FailingCamera.captures += 1
+            fail = FailingCamera.captures == self.fail_at
+        if fail:
+            raise RuntimeError("rasterization failed")
+        super().capture_mobjects(mobjects, **kwargs)
+
+
+class TwoPlays(BoundedMemoryScene):
+    write_memory_report = False
+
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=FailingCamera, **kwargs)
+
+    def construct(self):
+        square = manim.Square()
+        self.play(manim.Create(square), run_time=1)
+        self.play(square.animate.shift(manim.RIGHT), run_time=1)
+
+
+def render(threads, rss_limit_mb=None, fail_at=None):
+    """Render TwoPlays with ``threads`` and return the scene."""
+    FailingCamera.fail_at, FailingCamera.captures = fail_at, 0
+    with manim.tempconfig({
+        "quality": "low_quality", "dry_run": True, "disable_caching": True,
+        "progress_bar": "none", "verbosity": "WARNING",
+    }):
+        scene = TwoPlays()
+        scene.render_threads = threads
+        if rss_limit_mb is not None:
+            scene.rss_limit = rss_limit_mb * bounded_memory.MB
+        try:
+            scene.render()
+        finally:
+            FailingCamera.fail_at = None
+    return scene
+
+
+def test_ceiling_below_baseline_warns_once_per_scene(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(bounded_memory.logger, "warning", warnings.append)
+    scene = render(threads=1, rss_limit_mb=1)
+
+    assert len([w for w in warnings if "after the encoder drained" in w]) == 1
+    assert len(scene.memory) == 2
+    assert all(m["drained_over_frames"] > 0 for m in scene.memory)
+
+
+@pytest.mark.parametrize("threads", [1, 3])
+def test_failed_render_returns_its_buffer(threads, monkeypatch):
+    scenes = []
+    init = TwoPlays.__init__
+
+    def recording_init(self, **kwargs):
+        init(self, **kwargs)
+        scenes.append(self)
+
+    monkeypatch.setattr(TwoPlays, "__init__", recording_init)
+    # Play 0 rasterizes a static frame and 15 frames at -ql; fail in play 1
+    with pytest.raises(RuntimeError, match="rasterization failed"):
+        render(threads, fail_at=20)
+
+    pool = scenes[0].frame_pool
+    assert pool.allocated > 0
+    assert pool.in_use() == 0
+    assert len(pool.free) == pool.allocated
@@ -0,0 +1,45 @@
+import numpy as np
+
+from gaussian_fit import NUM_PARAMS, GaussianImageFitter, disk_target
+
+
+def float64_fitter(**kwargs):
+    """A small fitter with every float32 buffer widened, for finite differences."""
+    target = disk_target(24, 18, center=(12, 9), radius=5, color=(0.9, 0.4, 0.1),
+                         background=(0.1, 0.1, 0.2))
+    fitter = GaussianImageFitter(target, capacity=16, **kwargs)
+    for name, value in vars(fitter).items():
+        if isinstance(value, np.ndarray) and value.dtype == np.float32:
+            setattr(fitter, name, value.astype(np.float64))
+    return fitter
+
+
+def test_backward_matches_finite_differences():
+    fitter = float64_fitter(num_gaussians=6, init_scale=1.2, init_opacity=0.5, seed=4)
+    p = fitter.params[:fitter.n]
+    # Keep every patch inside the image, means off pixel boundaries (the
+    # patch moves with the integer part) and scales away from the clamps
+    p[:, 0] = fitter.rng.uniform(6, 18, fitter.n).round() + 0.37
+    p[:, 1] = fitter.rng.uniform(6, 12, fitter.n).round() + 0.61
+    p[:, 2:4] += fitter.rng.uniform(-0.2, 0.2, size=(fitter.n, 2))
+
+    fitter.render()
+    grads = fitter.backward().copy()
+
+    def loss():
+        image = fitter.render()
+        return np.mean((image - fitter.target) ** 2)
+
+    eps = 1e-6
+    numeric = np.empty_like(grads)
+    for i in range(fitter.n):
+        for j in range(NUM_PARAMS):
+            saved = p[i, j]
+            p[i, j] = saved + eps
+            plus = loss()
+            p[i, j] = saved - eps
+            minus = loss()
+            p[i, j] = saved
+            numeric[i, j] = (plus - minus) / (2 * eps)
+
+    np.testing.assert_allclose(grads, numeric, rtol=1e-5, atol=1e-9)
@@ -0,0 +1,63 @@
+import hashlib
+
+import pytest
+
+pytest.importorskip("cairo")
+manim = pytest.importorskip("manim")
+
+from parallel_render import ParallelRenderScene, default_thread_count
+
+
+class ShortScene(ParallelRenderScene):
+    parallel_plays = 0
+
+    def construct(self):
+        square = manim.Square(fill_opacity=0.5)
+        dots = manim.VGroup(*[manim.Dot(manim.RIGHT * i) for i in range(3)])
+        self.play(
+            manim.Create(square),
+            manim.LaggedStart(*[manim.GrowFromCenter(d) for d in dots], lag_ratio=0.3),
+            run_time=1,
+        )
+        self.play(manim.Transform(square, manim.Circle(color=manim.RED)), run_time=1)
+
+    def render_frames_parallel(self, times):
+        ShortScene.parallel_plays += 1
+        super().render_frames_parallel(times)
+
+
+def frame_hashes(threads):
+    hashes = []
+    with manim.tempconfig({
+        "quality": "low_quality", "dry_run": True, "disable_caching": True,
+        "progress_bar": "none", "verbosity": "WARNING",
+    }):
+        scene = ShortScene()
+        scene.render_threads = threads
+        add_frame = scene.renderer.add_frame
+
+        def hashing_add_frame(frame, num_frames=1):
+            hashes.append(hashlib.sha1(frame.tobytes()).hexdigest())
+            add_frame(frame, num_frames)
+
+        scene.renderer.add_frame = hashing_add_frame
+        scene.render()
+    return hashes
+
+
+def test_threads_are_opt_in(monkeypatch):
+    monkeypatch.delenv("MANIM_RENDER_THREADS", raising=False)
+    assert default_thread_count() == 1
+    monkeypatch.setenv("MANIM_RENDER_THREADS", "3")
+    assert default_thread_count() == 3
+
+
+def test_parallel_frames_match_serial():
+    ShortScene.parallel_plays = 0
+    serial = frame_hashes(1)
+    assert ShortScene.parallel_plays == 0
+
+    parallel = frame_hashes(3)
+    assert ShortScene.parallel_plays == 2
+    assert len(serial) >= 2 * ParallelRenderScene.min_parallel_frames
+    assert parallel == serial
@@ -0,0 +1,61 @@
+import numpy as np
+
+from spherical_harmonics import (
+    SCRATCH_ROWS,
+    SHEvaluator,
+    eval_sh,
+    eval_sh_naive,
+    num_coeffs,
+    random_sh,
+    sh_basis,
+    sh_basis_naive,
+    sh_basis_planes,
+    view_directions,
+)
+
+
+def test_eval_sh_accepts_float64():
+    rng = np.random.default_rng(0)
+    sh = random_sh(64, rng=rng).astype(np.float64)
+    positions = rng.normal(size=(64, 3))
+    per_gaussian = view_directions(positions, [0.0, 0.0, 5.0]).astype(np.float64)
+    shared = np.array([0.0, 0.0, -1.0])
+
+    for dirs in (shared, per_gaussian):
+        colors = eval_sh(sh, dirs)
+        assert colors.dtype == np.float32
+        np.testing.assert_allclose(colors, eval_sh_naive(sh, dirs), atol=1e-5)
+
+
+def test_eval_sh_partial_degree_matches_naive():
+    rng = np.random.default_rng(1)
+    sh = random_sh(16, rng=rng)
+    dirs = view_directions(rng.normal(size=(16, 3)), [1.0, 2.0, 3.0])
+    for degree in range(4):
+        np.testing.assert_allclose(eval_sh(sh, dirs, degree), eval_sh_naive(sh, dirs, degree), atol=1e-5)
+
+
+def test_sh_basis_planes_reuses_buffers():
+    rng = np.random.default_rng(2)
+    out = np.empty((num_coeffs(3), 32), dtype=np.float32)
+    scratch = np.empty((SCRATCH_ROWS, 32), dtype=np.float32)
+    for degree in range(4):
+        # Raw offsets: the basis normalizes them itself
+        offsets = rng.normal(size=(32, 3)) * 4
+        planes = sh_basis_planes(offsets, degree, out[:num_coeffs(degree)], scratch)
+        expected = np.array([sh_basis_naive(d, degree) for d in offsets]).T
+        np.testing.assert_allclose(planes, expected, atol=1e-6)
+        np.testing.assert_allclose(sh_basis(offsets, degree), expected.T, atol=1e-6)
+
+
+def test_sh_evaluator_matches_eval_sh():
+    rng = np.random.default_rng(3)
+    sh = random_sh(48, rng=rng)
+    positions = rng.normal(size=(48, 3))
+    evaluate = SHEvaluator(sh)
+    first = evaluate(view_directions(positions, [0.0, 0.0, 5.0]))
+    for eye in ([3.0, 1.0, 4.0], [-2.0, 0.5, -5.0]):
+        dirs = view_directions(positions, eye)
+        colors = evaluate(dirs)
+        assert colors is first
+        np.testing.assert_allclose(colors, eval_sh(sh, dirs), atol=1e-6)
@@ -0,0 +1,31 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from vector_export import export_scene
+
+
+class WaitingScene(manim.Scene):
+    def construct(self):
+        self.play(manim.Create(manim.Square()), run_time=0.5)
+        self.wait(0.5)
+
+        dot = manim.Dot()
+        dot.add_updater(lambda m, dt: m.shift(manim.RIGHT * dt))
+        self.add(dot)
+        self.wait(0.5)
+
+
+def test_export_scene_with_waits():
+    with manim.tempconfig({"dry_run": True, "disable_caching": True, "verbosity": "WARNING"}):
+        timeline = export_scene(WaitingScene, fps=10)
+
+    assert timeline["duration"] == 1.5
+    assert len(timeline["plays"]) == 1
+    times = [frame["t"] for frame in timeline["keyframes"]]
+    assert times == sorted(times)
+    # The static wait is a single keyframe; the updating one is sampled
+    assert times.count(1.0) == 1
+    assert {t for t in times if t > 1.0} == {1.1, 1.2, 1.3, 1.4, 1.5}
+    moved = [frame for frame in timeline["keyframes"] if frame["t"] > 1.0 and "set" in frame]
+    assert moved[-1]["set"]
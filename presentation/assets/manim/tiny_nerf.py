@@ -0,0 +1,690 @@
+"""Train a tiny NeRF on the CPU with a multiresolution hash-grid encoding.
+
+A small, real version of the loop shown in NeRFTraining: cast rays from
+photos, render them through the network, compare with the photo pixels
+and adjust the weights.
+
+    position --hash grid--> features --MLP--> density, geometry features
+    geometry features + SH(view direction) --MLP--> color
+
+The hash grid follows Instant-NGP: L levels of trainable feature tables,
+trilinearly interpolated, dense at coarse resolutions and spatially
+hashed at fine ones. Density and color networks have a single hidden
+layer of 64 units. Every forward and backward pass (encoding lookup and
+scatter, MLPs, volume rendering) is written out in NumPy, vectorized over
+all samples of a batch of rays.
+
+Training data is a synthetic multi-view scene (two spheres and a cube on
+a floor) defined by signed distance functions and rendered with a dense
+reference volume renderer, so no dataset download is needed.
+
+A batch can be split over a thread pool (``workers``); NumPy releases the
+GIL inside the large array operations, so chunks run concurrently on a
+multi-core CPU and their gradients are summed.
+
+Benchmark:
+    python tiny_nerf.py
+"""
+
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from gaussian_fit import sigmoid
+from spherical_harmonics import num_coeffs, sh_basis
+
+# Spatial hash primes from Instant-NGP (the first axis is not scrambled)
+HASH_PRIMES = (1, 2654435761, 805459861)
+
+VIEW_DEGREE = 3
+BACKGROUND = (0.1, 0.1, 0.12)
+
+# Bump when the cached arrays or the training they come from change
+# meaning; the sources training runs on are hashed into the key as well
+CACHE_FORMAT = 2
+CACHE_SOURCES = ("tiny_nerf.py", "gaussian_fit.py", "spherical_harmonics.py")
+
+
+def hex_to_rgb(color):
+    color = color.lstrip("#")
+    return np.array([int(color[i:i + 2], 16) / 255 for i in (0, 2, 4)], dtype=np.float32)
+
+
+# Cameras and rays
+
+def look_at(eye, target=(0, 0, 0), up=(0, 1, 0)):
+    """Camera-to-world rotation whose columns are right, up and backward."""
+    eye = np.asarray(eye, dtype=np.float32)
+    backward = eye - np.asarray(target, dtype=np.float32)
+    backward /= np.linalg.norm(backward)
+    right = np.cross(up, backward)
+    right /= np.linalg.norm(right)
+    return np.stack([right, np.cross(backward, right), backward], axis=1).astype(np.float32)
+
+
+def orbit_cameras(count, radius=3.2, elevations=(20, 40), target=(0, -0.3, 0), offset=0.0):
+    """Camera positions spread around the scene, alternating elevation."""
+    eyes = []
+    for i in range(count):
+        azimuth = 2 * np.pi * (i / count + offset)
+        elevation = np.radians(elevations[i % len(elevations)])
+        eyes.append(np.array(target) + radius * np.array([
+            np.cos(elevation) * np.sin(azimuth),
+            np.sin(elevation),
+            np.cos(elevation) * np.cos(azimuth),
+        ]))
+    return np.array(eyes, dtype=np.float32)
+
+
+def camera_rays(eye, width, height, fov=40.0, target=(0, -0.3, 0)):
+    """Origins and unit directions, (H * W, 3) each, through pixel centers."""
+    focal = 0.5 * height / np.tan(np.radians(fov) / 2)
+    ys, xs = np.mgrid[0:height, 0:width] + 0.5
+    local = np.stack([
+        (xs - width / 2) / focal,
+        -(ys - height / 2) / focal,
+        -np.ones_like(xs),
+    ], axis=-1).reshape(-1, 3)
+    dirs = local @ look_at(eye, target).T
+    dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+    origins = np.broadcast_to(np.asarray(eye, dtype=np.float32), dirs.shape)
+    return origins.astype(np.float32), dirs.astype(np.float32)
+
+
+def ray_box(origins, dirs, bound):
+    """Near / far distances where rays cross the [-bound, bound]^3 box.
+
+    Rays that miss the box get near == far, so all their samples have
+    zero length and they render as background.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv = 1.0 / dirs
+        t0 = (-bound - origins) * inv
+        t1 = (bound - origins) * inv
+    near = np.nan_to_num(np.minimum(t0, t1), nan=-np.inf).max(axis=1)
+    far = np.nan_to_num(np.maximum(t0, t1), nan=np.inf).min(axis=1)
+    near = np.maximum(near, 0)
+    far = np.maximum(far, near)
+    return near.astype(np.float32), far.astype(np.float32)
+
+
+def sample_along_rays(near, far, num_samples, rng=None):
+    """Sample distances (R, S) and segment lengths (R, S).
+
+    With an rng the samples are stratified (one uniform sample per bin),
+    otherwise they sit at the bin centers.
+    """
+    bins = np.arange(num_samples, dtype=np.float32)
+    if rng is None:
+        u = np.full((len(near), num_samples), 0.5, dtype=np.float32)
+    else:
+        u = rng.random((len(near), num_samples), dtype=np.float32)
+    step = ((far - near) / num_samples)[:, None]
+    t = near[:, None] + (bins + u) * step
+    deltas = np.empty_like(t)
+    deltas[:, :-1] = t[:, 1:] - t[:, :-1]
+    deltas[:, -1] = far - t[:, -1]
+    return t, deltas
+
+
+# Volume rendering
+
+def volume_render(sigma, rgb, deltas, background):
+    """Alpha-composite samples front to back.
+
+    sigma, deltas: (R, S); rgb: (R, S, 3). Returns the ray colors (R, 3)
+    and the intermediates needed by volume_render_backward.
+    """
+    alpha_tau = sigma * deltas
+    trans = np.exp(-np.cumsum(alpha_tau, axis=1))     # T_{i+1}
+    trans_before = np.empty_like(trans)               # T_i
+    trans_before[:, 0] = 1.0
+    trans_before[:, 1:] = trans[:, :-1]
+    weights = trans_before - trans                    # T_i * (1 - exp(-sigma_i * delta_i))
+    final = trans[:, -1]
+    color = np.einsum("rs,rsc->rc", weights, rgb) + final[:, None] * np.asarray(background, dtype=np.float32)
+    return color, (weights, trans, final)
+
+
+def volume_render_backward(grad_color, sigma, rgb, deltas, background, cache):
+    """Gradients w.r.t. sigma (R, S) and rgb (R, S, 3).
+
+    With C = sum_j w_j c_j + T_N * bg:
+
+        dC/dc_i     = w_i
+        dC/dsigma_i = delta_i * (T_{i+1} c_i - sum_{j>i} w_j c_j - T_N * bg)
+    """
+    weights, trans, final = cache
+    grad_rgb = weights[..., None] * grad_color[:, None, :]
+
+    projected = np.einsum("rsc,rc->rs", rgb, grad_color)       # c_i . dL/dC
+    contribution = weights * projected
+    behind = contribution.sum(axis=1, keepdims=True) - np.cumsum(contribution, axis=1)
+    behind += (final * (grad_color @ np.asarray(background, dtype=np.float32)))[:, None]
+    grad_sigma = deltas * (trans * projected - behind)
+    return grad_sigma, grad_rgb
+
+
+# Encoding and network
+
+class HashGrid:
+    """Multiresolution hash encoding of points in [0, 1]^3.
+
+    Level l has resolution floor(base * b^l), with b chosen so the last
+    level reaches ``max_resolution``. Output is (P, levels * features).
+
+    Tables are stored feature-major, (levels, features, T), and corners
+    lead every per-point array, (8, P): NumPy is far faster when the
+    long point axis is the contiguous one.
+    """
+
+    def __init__(self, levels=8, table_size=2 ** 14, features=2, base_resolution=8,
+                 max_resolution=128, rng=None):
+        if table_size & (table_size - 1):
+            raise ValueError(f"table_size must be a power of two, got {table_size}")
+        rng = np.random.default_rng(0) if rng is None else rng
+        growth = np.exp((np.log(max_resolution) - np.log(base_resolution)) / max(levels - 1, 1))
+        self.levels = levels
+        self.table_size = table_size
+        self.features = features
+        self.resolutions = np.floor(base_resolution * growth ** np.arange(levels) + 1e-6).astype(np.int64)
+        self.dense = (self.resolutions + 1) ** 3 <= table_size
+        self.output_dim = levels * features
+        self.table = rng.uniform(-1e-4, 1e-4, (levels, features, table_size)).astype(np.float32)
+
+    def corners(self, xt, level):
+        """Table indices (8, P) and trilinear weights (8, P) of each point's cell.
+
+        xt holds the points axis-major, (3, P).
+        """
+        res = self.resolutions[level]
+        scaled = xt * np.float32(res)
+        base = np.floor(scaled)
+        frac = scaled - base
+        base = base.astype(np.int64)
+
+        # Index of the lower and upper corner along each axis, (2, P)
+        if self.dense[level]:
+            strides = [(res + 1) ** a for a in range(3)]
+            axes = [np.stack([base[a] * strides[a], (base[a] + 1) * strides[a]]) for a in range(3)]
+            idx = axes[0][:, None, None] + axes[1][None, :, None] + axes[2][None, None, :]
+        else:
+            axes = [
+                np.stack([base[a], base[a] + 1]).astype(np.uint32) * np.uint32(HASH_PRIMES[a])
+                for a in range(3)
+            ]
+            idx = axes[0][:, None, None] ^ axes[1][None, :, None] ^ axes[2][None, None, :]
+            idx = (idx & np.uint32(self.table_size - 1)).astype(np.int64)
+
+        w = [np.stack([1 - frac[a], frac[a]]) for a in range(3)]
+        weights = w[0][:, None, None] * w[1][None, :, None] * w[2][None, None, :]
+        return idx.reshape(8, -1), weights.reshape(8, -1)
+
+    def encode(self, x):
+        """Features (P, levels * features) and the cache for backward."""
+        xt = np.ascontiguousarray(np.clip(x, 0, 1 - 1e-6).T)
+        out = np.empty((len(x), self.output_dim), dtype=np.float32)
+        cache = []
+        f = self.features
+        for level in range(self.levels):
+            idx, weights = self.corners(xt, level)
+            for k in range(f):
+                out[:, level * f + k] = np.einsum("cp,cp->p", weights, self.table[level, k][idx])
+            cache.append((idx, weights))
+        return out, cache
+
+    def backward(self, grad, cache):
+        """Scatter dL/dfeatures (P, levels * features) into the tables."""
+        grad_table = np.zeros_like(self.table)
+        f = self.features
+        for level, (idx, weights) in enumerate(cache):
+            flat = idx.ravel()
+            for k in range(f):
+                corner_grad = weights * grad[:, level * f + k]
+                grad_table[level, k] = np.bincount(flat, weights=corner_grad.ravel(),
+                                                   minlength=self.table_size)
+        return grad_table
+
+
+class TinyNeRF:
+    """Hash grid, a density MLP and a view-dependent color MLP.
+
+    density:  encoding -> 64 -> ReLU -> 16, sigma = exp(first output)
+    color:    16 geometry outputs + SH(view direction) -> 64 -> ReLU -> 3, sigmoid
+    """
+
+    def __init__(self, hidden=64, geometry=16, view_degree=VIEW_DEGREE, rng=None, **grid_kwargs):
+        rng = np.random.default_rng(0) if rng is None else rng
+        self.grid = HashGrid(rng=rng, **grid_kwargs)
+        self.view_degree = view_degree
+        view_dim = num_coeffs(view_degree)
+
+        def he(fan_in, fan_out):
+            return (rng.normal(size=(fan_in, fan_out)) * np.sqrt(2.0 / fan_in)).astype(np.float32)
+
+        self.params = {
+            "table": self.grid.table,
+            "W1": he(self.grid.output_dim, hidden),
+            "b1": np.zeros(hidden, dtype=np.float32),
+            "W2": he(hidden, geometry),
+            "b2": np.zeros(geometry, dtype=np.float32),
+            "W3": he(geometry + view_dim, hidden),
+            "b3": np.zeros(hidden, dtype=np.float32),
+            "W4": he(hidden, 3),
+            "b4": np.zeros(3, dtype=np.float32),
+        }
+        self.geometry = geometry
+
+    def view_encoding(self, dirs):
+        return sh_basis(dirs, self.view_degree)
+
+    def density(self, x):
+        """Density only, for points x (P, 3) in [0, 1]^3."""
+        p = self.params
+        enc, _ = self.grid.encode(x)
+        h1 = np.maximum(enc @ p["W1"] + p["b1"], 0)
+        return np.exp(np.clip(h1 @ p["W2"][:, 0] + p["b2"][0], -15, 15))
+
+    def forward(self, x, view, ray_index):
+        """Density (P,) and color (P, 3) for points x (P, 3) in [0, 1]^3.
+
+        ``view`` holds the SH encoding of each ray's direction (R, K) and
+        ``ray_index`` (P,) the ray each point was sampled on.
+        """
+        p = self.params
+        enc, grid_cache = self.grid.encode(x)
+        h1 = enc @ p["W1"] + p["b1"]
+        np.maximum(h1, 0, out=h1)
+        geo = h1 @ p["W2"] + p["b2"]
+        sigma = np.exp(np.clip(geo[:, 0], -15, 15))
+
+        # The view part of the first color layer is the same for every
+        # sample along a ray, so it is computed once per ray
+        g = self.geometry
+        per_ray = view @ p["W3"][g:] + p["b3"]
+        h3 = geo @ p["W3"][:g]
+        h3 += per_ray[ray_index]
+        np.maximum(h3, 0, out=h3)
+        rgb = sigmoid(h3 @ p["W4"] + p["b4"])
+        return sigma, rgb, (enc, grid_cache, h1, geo, sigma, view, ray_index, h3, rgb)
+
+    def backward(self, grad_sigma, grad_rgb, cache):
+        """Parameter gradients for dL/dsigma (P,) and dL/drgb (P, 3)."""
+        enc, grid_cache, h1, geo, sigma, view, ray_index, h3, rgb = cache
+        p = self.params
+        g = self.geometry
+        grads = {}
+
+        dz4 = grad_rgb * rgb * (1 - rgb)
+        grads["W4"] = h3.T @ dz4
+        grads["b4"] = dz4.sum(axis=0)
+        dz3 = dz4 @ p["W4"].T
+        dz3 *= h3 > 0
+
+        grads["W3"] = np.concatenate([geo.T @ dz3, view[ray_index].T @ dz3])
+        grads["b3"] = dz3.sum(axis=0)
+
+        dgeo = dz3 @ p["W3"][:g].T
+        dgeo[:, 0] += grad_sigma * sigma * (np.abs(geo[:, 0]) < 15)
+        grads["W2"] = h1.T @ dgeo
+        grads["b2"] = dgeo.sum(axis=0)
+        dz1 = dgeo @ p["W2"].T
+        dz1 *= h1 > 0
+        grads["W1"] = enc.T @ dz1
+        grads["b1"] = dz1.sum(axis=0)
+        grads["table"] = self.grid.backward(dz1 @ p["W1"].T, grid_cache)
+        return grads
+
+
+class Adam:
+    """Adam over a dict of arrays, updated in place."""
+
+    def __init__(self, params, lr=1e-2, beta1=0.9, beta2=0.99, eps=1e-15):
+        self.params = params
+        self.lr = lr
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self.t = 0
+        self.m = {name: np.zeros_like(value) for name, value in params.items()}
+        self.v = {name: np.zeros_like(value) for name, value in params.items()}
+
+    def step(self, grads):
+        self.t += 1
+        correction1 = 1 - self.beta1 ** self.t
+        correction2 = 1 - self.beta2 ** self.t
+        for name, grad in grads.items():
+            m, v = self.m[name], self.v[name]
+            m *= self.beta1
+            m += (1 - self.beta1) * grad
+            v *= self.beta2
+            v += (1 - self.beta2) * grad * grad
+            self.params[name] -= self.lr / correction1 * m / (np.sqrt(v / correction2) + self.eps)
+
+
+# Training
+
+class NeRFTrainer:
+    """Trains a TinyNeRF on posed images with random batches of rays.
+
+    images: (V, H, W, 3) in [0, 1]; origins, dirs: (V, H * W, 3).
+    With ``workers`` > 1 the trainer owns a thread pool; ``close()`` it, or
+    use the trainer as a context manager.
+    """
+
+    def __init__(self, images, origins, dirs, bound=1.0, num_samples=48, batch_size=1024,
+                 lr=1e-2, workers=1, background=BACKGROUND, occupancy_resolution=32,
+                 occupancy_every=16, occupancy_threshold=0.01, seed=0, **model_kwargs):
+        self.images = np.asarray(images, dtype=np.float32)
+        self.num_views, self.height, self.width = self.images.shape[:3]
+        self.bound = bound
+        self.num_samples = num_samples
+        self.batch_size = batch_size
+        self.workers = workers
+        self.background = np.asarray(background, dtype=np.float32)
+        self.rng = np.random.default_rng(seed)
+
+        # Every pixel of every view is one training ray
+        self.origins = np.asarray(origins, dtype=np.float32).reshape(-1, 3)
+        self.dirs = np.asarray(dirs, dtype=np.float32).reshape(-1, 3)
+        self.colors = self.images.reshape(-1, 3)
+        self.near, self.far = ray_box(self.origins, self.dirs, bound)
+
+        self.model = TinyNeRF(rng=self.rng, **model_kwargs)
+        self.view = self.model.view_encoding(self.dirs)
+        self.optimizer = Adam(self.model.params, lr=lr)
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="nerf") if workers > 1 else None
+
+        # Occupancy grid over the scene box (as in Instant-NGP): samples in
+        # cells whose density has decayed below the threshold are skipped.
+        # Everything counts as occupied until the first update.
+        n = occupancy_resolution
+        self.occupancy_resolution = n
+        self.occupancy_every = occupancy_every
+        self.occupancy_threshold = occupancy_threshold
+        self.step_size = 2 * np.sqrt(3) * bound / num_samples
+        self.cells = np.stack(np.meshgrid(*[np.arange(n)] * 3, indexing="ij"), axis=-1).reshape(-1, 3)
+        self.density_grid = np.zeros(n ** 3, dtype=np.float32)
+        self.occupancy = np.ones(n ** 3, dtype=bool)
+
+        self.iteration = 0
+        self.loss = float("nan")
+        self.rays_trained = 0
+        self.train_time = 0.0
+
+    def points(self, rays, t):
+        """Sample positions along rays, mapped from the scene box to [0, 1]^3."""
+        pts = self.origins[rays, None] + self.dirs[rays, None] * t[..., None]
+        return (pts.reshape(-1, 3) + self.bound) / (2 * self.bound)
+
+    def is_occupied(self, x):
+        n = self.occupancy_resolution
+        cell = np.clip((x * n).astype(np.int64), 0, n - 1)
+        return self.occupancy[(cell[:, 0] * n + cell[:, 1]) * n + cell[:, 2]]
+
+    def update_occupancy(self, decay=0.95, chunk=65536):
+        """Re-evaluate the density at a random point in every cell."""
+        x = (self.cells + self.rng.random(self.cells.shape, dtype=np.float32)) / self.occupancy_resolution
+        density = np.concatenate([
+            self.model.density(x[start:start + chunk]) for start in range(0, len(x), chunk)
+        ])
+        np.maximum(self.density_grid * decay, density, out=self.density_grid)
+        self.occupancy = self.density_grid * self.step_size > self.occupancy_threshold
+
+    def render_rays(self, rays, t, deltas):
+        """Colors (R, 3) of rays sampled at distances t (R, S)."""
+        shape = t.shape
+        x = self.points(rays, t)
+        occupied = self.is_occupied(x)
+        ray_index = np.repeat(np.arange(len(rays)), shape[1])[occupied]
+
+        sigma = np.zeros(len(x), dtype=np.float32)
+        rgb = np.zeros((len(x), 3), dtype=np.float32)
+        sigma[occupied], rgb[occupied], cache = self.model.forward(x[occupied], self.view[rays], ray_index)
+        color, render_cache = volume_render(sigma.reshape(shape), rgb.reshape(shape + (3,)), deltas,
+                                            self.background)
+        return color, (sigma, rgb, occupied, cache, render_cache)
+
+    def _chunk_gradients(self, rays, t, deltas, scale):
+        color, (sigma, rgb, occupied, cache, render_cache) = self.render_rays(rays, t, deltas)
+        error = color - self.colors[rays]
+        shape = t.shape
+        grad_sigma, grad_rgb = volume_render_backward(
+            scale * error, sigma.reshape(shape), rgb.reshape(shape + (3,)), deltas,
+            self.background, render_cache)
+        grads = self.model.backward(grad_sigma.ravel()[occupied], grad_rgb.reshape(-1, 3)[occupied], cache)
+        return grads, float(np.sum(error ** 2))
+
+    def step(self):
+        """One batch of rays: render, compare, adjust. Returns the MSE."""
+        start = time.perf_counter()
+        rays = self.rng.integers(0, len(self.origins), self.batch_size)
+        t, deltas = sample_along_rays(self.near[rays], self.far[rays], self.num_samples, self.rng)
+        scale = 2.0 / (self.batch_size * 3)
+
+        if self.pool is None:
+            grads, squared_error = self._chunk_gradients(rays, t, deltas, scale)
+        else:
+            chunks = np.array_split(np.arange(self.batch_size), self.workers)
+            results = list(self.pool.map(
+                lambda c: self._chunk_gradients(rays[c], t[c], deltas[c], scale), chunks))
+            grads, squared_error = results[0]
+            for chunk_grads, chunk_error in results[1:]:
+                for name, value in chunk_grads.items():
+                    grads[name] += value
+                squared_error += chunk_error
+
+        self.optimizer.step(grads)
+        self.loss = squared_error / (self.batch_size * 3)
+        self.iteration += 1
+        if self.iteration % self.occupancy_every == 0:
+            self.update_occupancy()
+        self.rays_trained += self.batch_size
+        self.train_time += time.perf_counter() - start
+        return self.loss
+
+    @property
+    def rays_per_second(self):
+        return self.rays_trained / self.train_time if self.train_time else 0.0
+
+    def render_view(self, view, chunk=4096):
+        """Render training view ``view`` with evenly spaced samples; (H, W, 3)."""
+        pixels = self.height * self.width
+        rays = np.arange(view * pixels, (view + 1) * pixels)
+        image = np.empty((pixels, 3), dtype=np.float32)
+        for start in range(0, pixels, chunk):
+            batch = rays[start:start + chunk]
+            t, deltas = sample_along_rays(self.near[batch], self.far[batch], self.num_samples)
+            image[start:start + chunk] = self.render_rays(batch, t, deltas)[0]
+        return np.clip(image, 0, 1).reshape(self.height, self.width, 3)
+
+    def snapshot(self, view=0):
+        image = self.render_view(view)
+        mse = float(np.mean((image - self.images[view]) ** 2))
+        return {
+            "iteration": self.iteration,
+            "loss": mse,
+            "psnr": float(-10 * np.log10(max(mse, 1e-10))),
+            "image": image,
+            "rays_per_second": self.rays_per_second,
+            "occupied": float(self.occupancy.mean()),
+        }
+
+    def run(self, iterations, snapshot_at=(), view=0):
+        """Train for ``iterations`` steps, yielding snapshots of ``view``.
+
+        Each snapshot renders the whole training view with evenly spaced
+        samples (no jitter), so it costs about as much as a few steps.
+        The untrained network is rendered first if 0 is in ``snapshot_at``.
+        """
+        snapshot_at = set(snapshot_at)
+        if 0 in snapshot_at and self.iteration == 0:
+            yield self.snapshot(view)
+        for _ in range(iterations):
+            self.step()
+            if self.iteration in snapshot_at:
+                yield self.snapshot(view)
+
+    def close(self):
+        """Shut down the worker threads."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Synthetic training scene
+
+class SyntheticScene:
+    """Spheres and boxes on a floor, described by signed distance functions.
+
+    Density is a steep sigmoid of the distance and color is the albedo of
+    the closest shape, lit by one directional light.
+    """
+
+    def __init__(self, sharpness=0.01, max_density=100.0, light=(0.4, 0.8, 0.5), ambient=0.35):
+        self.sharpness = sharpness
+        self.max_density = max_density
+        self.light = np.asarray(light, dtype=np.float32) / np.linalg.norm(light)
+        self.ambient = ambient
+        self.shapes = [
+            ("box", (0.0, -0.8, 0.0), (0.9, 0.05, 0.9), "#888899"),
+            ("sphere", (-0.2, -0.25, 0.0), 0.5, "#00b3e7"),
+            ("sphere", (0.5, -0.55, 0.45), 0.2, "#ff6b6b"),
+            ("box", (0.45, -0.53, -0.4), (0.22, 0.22, 0.22), "#f4c542"),
+        ]
+        self.albedo = np.stack([hex_to_rgb(shape[3]) for shape in self.shapes])
+
+    def sdf(self, points):
+        """Distance to the closest shape (P,) and its index (P,)."""
+        distances = np.empty((len(self.shapes), len(points)), dtype=np.float32)
+        for i, (kind, center, size, _) in enumerate(self.shapes):
+            d = points - np.asarray(center, dtype=np.float32)
+            if kind == "sphere":
+                distances[i] = np.linalg.norm(d, axis=1) - size
+            else:
+                q = np.abs(d) - np.asarray(size, dtype=np.float32)
+                distances[i] = np.linalg.norm(np.maximum(q, 0), axis=1) + np.minimum(q.max(axis=1), 0)
+        closest = distances.argmin(axis=0)
+        return distances[closest, np.arange(len(points))], closest
+
+    def density(self, points):
+        distance, _ = self.sdf(points)
+        return self.max_density * sigmoid(np.clip(-distance / self.sharpness, -30, 30))
+
+    def color(self, points, eps=1e-3):
+        _, closest = self.sdf(points)
+        normal = np.empty_like(points)
+        for axis in range(3):
+            offset = np.zeros(3, dtype=np.float32)
+            offset[axis] = eps
+            normal[:, axis] = self.sdf(points + offset)[0] - self.sdf(points - offset)[0]
+        normal /= np.maximum(np.linalg.norm(normal, axis=1, keepdims=True), 1e-8)
+        diffuse = np.maximum(normal @ self.light, 0)
+        return self.albedo[closest] * (self.ambient + (1 - self.ambient) * diffuse)[:, None]
+
+    def render(self, origins, dirs, bound=1.0, num_samples=192, background=BACKGROUND, chunk=2048):
+        """Reference volume rendering of rays (R, 3) -> colors (R, 3)."""
+        colors = np.empty((len(origins), 3), dtype=np.float32)
+        for start in range(0, len(origins), chunk):
+            o, d = origins[start:start + chunk], dirs[start:start + chunk]
+            near, far = ray_box(o, d, bound)
+            t, deltas = sample_along_rays(near, far, num_samples)
+            points = (o[:, None] + d[:, None] * t[..., None]).reshape(-1, 3)
+            sigma = self.density(points)
+
+            # Shading is only needed where there is something to see
+            rgb = np.zeros((len(points), 3), dtype=np.float32)
+            solid = sigma > 1e-3
+            rgb[solid] = self.color(points[solid])
+            sigma, rgb = sigma.reshape(t.shape), rgb.reshape(t.shape + (3,))
+            colors[start:start + chunk] = volume_render(sigma, rgb, deltas, background)[0]
+        return colors
+
+
+def synthetic_dataset(num_views=24, width=56, height=40, bound=1.0, scene=None):
+    """Images (V, H, W, 3), ray origins and directions (V, H * W, 3)."""
+    scene = SyntheticScene() if scene is None else scene
+    origins, dirs = zip(*(camera_rays(eye, width, height) for eye in orbit_cameras(num_views)))
+    origins, dirs = np.stack(origins), np.stack(dirs)
+    images = np.stack([
+        scene.render(o, d, bound).reshape(height, width, 3) for o, d in zip(origins, dirs)
+    ])
+    return images, origins, dirs
+
+
+def progressive_renders(iterations, snapshot_at, view=0, cache_dir=None, num_views=24,
+                        width=56, height=40, workers=1, **trainer_kwargs):
+    """Train on the synthetic scene; returns (target image, snapshots).
+
+    Training takes a while, so with ``cache_dir`` the result is stored
+    there and reused on the next render. The key covers every argument
+    except ``workers``, CACHE_FORMAT and the CACHE_SOURCES modules.
+    """
+    settings = dict(iterations=iterations, snapshot_at=sorted(snapshot_at), view=view,
+                    num_views=num_views, width=width, height=height, **trainer_kwargs,
+                    format=CACHE_FORMAT,
+                    code=hashlib.sha1(b"".join(
+                        (Path(__file__).parent / name).read_bytes() for name in CACHE_SOURCES
+                    )).hexdigest())
+    path = None
+    if cache_dir is not None:
+        key = hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:12]
+        path = Path(cache_dir) / f"tiny_nerf_{key}.npz"
+        if path.exists():
+            with np.load(path) as data:
+                snapshots = [
+                    {"iteration": int(i), "loss": float(l), "psnr": float(p), "image": image,
+                     "rays_per_second": float(r)}
+                    for i, l, p, image, r in zip(data["iteration"], data["loss"], data["psnr"],
+                                                 data["image"], data["rays_per_second"])
+                ]
+                return data["target"], snapshots
+
+    images, origins, dirs = synthetic_dataset(num_views, width, height)
+    with NeRFTrainer(images, origins, dirs, workers=workers, **trainer_kwargs) as trainer:
+        snapshots = list(trainer.run(iterations, snapshot_at, view))
+
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path, target=images[view],
+            **{key: np.array([s[key] for s in snapshots])
+               for key in ("iteration", "loss", "psnr", "image", "rays_per_second")})
+    return images[view], snapshots
+
+
+def benchmark(iterations=1500, workers=(1, 2, 4)):
+    start = time.perf_counter()
+    images, origins, dirs = synthetic_dataset()
+    print(f"Dataset: {len(images)} views of {images.shape[2]}x{images.shape[1]} "
+          f"({time.perf_counter() - start:.1f} s)")
+
+    # Throughput only: a few steps per thread count
+    for count in workers:
+        with NeRFTrainer(images, origins, dirs, workers=count) as trainer:
+            trainer.step()
+            trainer.rays_trained, trainer.train_time = 0, 0.0
+            for _ in range(20):
+                trainer.step()
+        print(f"  workers={count}: {trainer.rays_per_second:,.0f} rays/s "
+              f"({trainer.num_samples} samples per ray)")
+
+    checkpoints = [0, 100, 300, 700, iterations]
+    with NeRFTrainer(images, origins, dirs, workers=max(workers)) as trainer:
+        for snapshot in trainer.run(iterations, checkpoints):
+            print(f"  iteration {snapshot['iteration']:>5}: PSNR {snapshot['psnr']:.2f} dB, "
+                  f"{snapshot['rays_per_second']:,.0f} rays/s, {trainer.train_time:.0f} s training")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,8 @@
+"""Unit conversions between Manim's conventions and frame coordinates.
+
+Shared by the scene auditor and the vector exporter, which both need
+them without depending on each other.
+"""
+
+# Manim stroke widths are in 1/100 of a frame unit (see Camera.apply_stroke)
+STROKE_WIDTH_SCALE = 0.01
@@ -0,0 +1,350 @@
+"""Export Manim scenes as vector keyframe timelines for GSAP playback.
+
+Runs each Scene's construct() without rasterizing anything. Every play()
+is sampled at a fixed rate and the SVG path and style of each visible
+mobject is recorded. The result is a compact JSON timeline that
+js/modules/diagram-animator.js (VectorTimelinePlayer) plays back with GSAP.
+
+Usage:
+    python vector_export.py                      # all scenes
+    python vector_export.py NeRFTraining --fps 20
+"""
+
+import argparse
+import base64
+import gzip
+import io
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+
+import nerf_raymarching
+from units import STROKE_WIDTH_SCALE
+
+SCENES = [
+    "NeRFRayMarching",
+    "GaussianSplatting",
+    "NeRFTraining",
+    "GaussianSplattingTraining",
+]
+
+HERE = Path(__file__).resolve().parent
+PRESENTATION_DIR = HERE.parents[1]
+DEFAULT_OUT_DIR = PRESENTATION_DIR / "assets" / "diagrams"
+
+# Rendered videos the timelines replace, for the size comparison
+VIDEO_FILES = {
+    "NeRFRayMarching": PRESENTATION_DIR / "assets/videos/nerf-raymarching.mp4",
+    "GaussianSplatting": PRESENTATION_DIR / "assets/videos/gaussiansplatting.mp4",
+    "NeRFTraining": PRESENTATION_DIR / "assets/videos/nerf-training.mp4",
+    "GaussianSplattingTraining": PRESENTATION_DIR / "assets/videos/gaussiansplatting-training.mp4",
+}
+MEDIA_VIDEO_DIR = HERE / "media/videos/nerf_raymarching/1080p60"
+
+
+def _num(value, precision):
+    value = round(float(value), precision)
+    if value == 0:
+        return "0"
+    return f"{value:.{precision}f}".rstrip("0").rstrip(".")
+
+
+def path_data(points, precision=3):
+    """SVG path string for a VMobject's cubic Bezier points (y flipped)."""
+    if len(points) < 4:
+        return ""
+    parts = []
+    fmt = lambda p: f"{_num(p[0], precision)} {_num(-p[1], precision)}"
+    curves = points[: len(points) - len(points) % 4].reshape(-1, 4, 3)
+    start = None
+    last = None
+    for a, h1, h2, b in curves:
+        if last is None or not np.allclose(a, last, atol=1e-6):
+            if start is not None and np.allclose(last, start, atol=1e-6):
+                parts.append("Z")
+            parts.append(f"M{fmt(a)}")
+            start = a
+        parts.append(f"C{fmt(h1)} {fmt(h2)} {fmt(b)}")
+        last = b
+    if start is not None and np.allclose(last, start, atol=1e-6):
+        parts.append("Z")
+    return "".join(parts)
+
+
+def image_href(pixels):
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def image_pixels(mobject):
+    """RGBA pixels of an ImageMobject with its opacity factored back out.
+
+    ImageMobject.set_opacity() scales the alpha channel in place, so fades
+    would otherwise re-encode the image on every keyframe.
+    """
+    pixels = np.array(mobject.get_pixel_array(), dtype=np.uint8)
+    if pixels.ndim == 3 and pixels.shape[2] == 4 and hasattr(mobject, "orig_alpha_pixel_array"):
+        pixels[:, :, 3] = mobject.orig_alpha_pixel_array
+    return pixels
+
+
+def to_hex(color):
+    return rgb_to_hex(color_to_rgb(color))
+
+
+class TimelineRecorder:
+    """Collects keyframes as deltas against the previous keyframe."""
+
+    def __init__(self, precision=3):
+        self.precision = precision
+        self.keyframes = []
+        self.plays = []
+        self.dom_order = []     # shape ids in SVG paint order
+        self.kinds = {}         # shape id -> "path" | "image"
+        self._keys = {}         # id(mobject) -> (shape id, mobject)
+        self._state = {}        # shape id -> last emitted attributes
+        self._base = {}         # shape id -> points the last "d" was built from
+        self._hrefs = {}        # pixel digest -> encoded image
+        self._visible = []
+
+    def _new_key(self, mobject):
+        key = np.base_repr(len(self.kinds), 36).lower()
+        # Keep the mobject alive so its id() is never reused by another one
+        self._keys[id(mobject)] = (key, mobject)
+        return key
+
+    def _place(self, visible_mobjects):
+        """Map mobjects to shape ids consistent with one global paint order.
+
+        SVG has no z-index, so when a mobject is drawn out of its previous
+        order (e.g. re-added on top) it gets a fresh shape id instead.
+        """
+        keys = []
+        used = set()
+        position = {key: i for i, key in enumerate(self.dom_order)}
+        last = -1
+        for mob in visible_mobjects:
+            key, _ = self._keys.get(id(mob), (None, None))
+            if key is not None and position.get(key, -1) > last and key not in used:
+                last = position[key]
+            else:
+                key = self._new_key(mob)
+                self.kinds[key] = "image" if isinstance(mob, ImageMobject) else "path"
+                self.dom_order.insert(last + 1, key)
+                position = {k: i for i, k in enumerate(self.dom_order)}
+                last += 1
+            keys.append(key)
+            used.add(key)
+        return keys
+
+    def _attributes(self, key, mob):
+        p = self.precision
+        if isinstance(mob, ImageMobject):
+            pixels = image_pixels(mob)
+            digest = hash((pixels.shape, pixels.tobytes()))
+            if digest not in self._hrefs:
+                self._hrefs[digest] = image_href(pixels)
+            left, top = mob.get_corner(UL)[:2]
+            return {
+                "x": round(float(left), p), "y": round(float(-top), p),
+                "w": round(float(mob.width), p), "h": round(float(mob.height), p),
+                "o": round(float(getattr(mob, "stroke_opacity", 1)), 3),
+                "href": self._hrefs[digest],
+            }
+
+        attrs = {
+            "fill": to_hex(mob.get_fill_color()),
+            "fo": round(float(mob.get_fill_opacity()), 3),
+            "stroke": to_hex(mob.get_stroke_color()),
+            "so": round(float(mob.get_stroke_opacity()), 3),
+            "sw": round(float(mob.get_stroke_width()) * STROKE_WIDTH_SCALE, 4),
+        }
+
+        # Pure translations (shift, move_to) only emit an offset instead of
+        # the whole path again
+        points = mob.points
+        base = self._base.get(key)
+        if base is not None and base.shape == points.shape and len(points):
+            delta = points[0] - base[0]
+            if np.allclose(points - base, delta, atol=10 ** -p):
+                attrs["t"] = [round(float(delta[0]), p), round(float(-delta[1]), p)]
+                return attrs
+        self._base[key] = points.copy()
+        attrs["d"] = path_data(points, p)
+        attrs["t"] = [0, 0]
+        return attrs
+
+    def snapshot(self, scene, t):
+        mobjects = list(scene.mobjects) + [m for m in scene.foreground_mobjects if m not in scene.mobjects]
+        family = extract_mobject_family_members(mobjects, only_those_with_points=True)
+        visible = [m for m in family if isinstance(m, (VMobject, ImageMobject))]
+        keys = self._place(visible)
+
+        frame = {"t": round(t, 4)}
+        was_visible = set(self._visible)
+        now_visible = set(keys)
+        shown = [k for k in keys if k not in was_visible]
+        hidden = [k for k in self._visible if k not in now_visible]
+        if shown:
+            frame["show"] = shown
+        if hidden:
+            frame["hide"] = hidden
+
+        changes = {}
+        for key, mob in zip(keys, visible):
+            attrs = self._attributes(key, mob)
+            previous = self._state.setdefault(key, {})
+            delta = {name: value for name, value in attrs.items() if previous.get(name) != value}
+            if delta:
+                previous.update(delta)
+                changes[key] = delta
+        if changes:
+            frame["set"] = changes
+
+        # Empty keyframes are kept: the player tweens each change from the
+        # previous keyframe, so dropping one would start the tween too early
+        self._visible = keys
+        self.keyframes.append(frame)
+
+    def to_json(self, scene_name, duration, fps):
+        frame_width = config.frame_width
+        frame_height = config.frame_height
+        return {
+            "version": 1,
+            "scene": scene_name,
+            "duration": round(duration, 4),
+            "fps": fps,
+            "viewBox": [-frame_width / 2, -frame_height / 2, frame_width, frame_height],
+            "background": to_hex(config.background_color),
+            "shapes": [{"id": key, "type": self.kinds[key]} for key in self.dom_order],
+            "plays": self.plays,
+            "keyframes": self.keyframes,
+        }
+
+
+class VectorExportMixin:
+    """Replaces play() and wait() with sampling into a TimelineRecorder."""
+
+    export_fps = 15
+
+    def setup_export(self, recorder, fps):
+        self.recorder = recorder
+        self.export_fps = fps
+        self.export_time = 0.0
+
+    def _sample_times(self, run_time):
+        n = max(2, math.ceil(run_time * self.export_fps))
+        return [run_time * i / n for i in range(1, n + 1)]
+
+    def play(self, *args, subcaption=None, subcaption_duration=None, subcaption_offset=0, **kwargs):
+        animations = self.compile_animations(*args, **kwargs)
+        self.add_mobjects_from_animations(animations)
+        run_time = self.get_run_time(animations)
+        for animation in animations:
+            animation._setup_scene(self)
+            animation.begin()
+
+        start = self.export_time
+        self.recorder.snapshot(self, start)
+        last_t = 0.0
+        for t in self._sample_times(run_time)[:-1]:
+            dt = t - last_t
+            last_t = t
+            for animation in animations:
+                animation.update_mobjects(dt)
+                animation.interpolate(min(t / animation.run_time, 1.0))
+            self.update_mobjects(dt)
+            self.recorder.snapshot(self, start + t)
+
+        for animation in animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        self.update_mobjects(0)
+        self.export_time = start + run_time
+        self.recorder.snapshot(self, self.export_time)
+        self.recorder.plays.append({
+            "t": round(start, 4),
+            "duration": round(run_time, 4),
+            "label": ", ".join(str(a) for a in animations)[:80],
+        })
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None, frozen_frame=None):
+        start = self.export_time
+        # Scene.should_update_mobjects() inspects the Wait in
+        # self.animations, which play() above never sets
+        updating = (
+            self.always_update_mobjects
+            or self.updaters
+            or stop_condition is not None
+            or any(m.has_time_based_updater() for m in self.get_mobject_family_members())
+        )
+        if updating and not frozen_frame:
+            last_t = 0.0
+            for t in self._sample_times(duration):
+                self.update_mobjects(t - last_t)
+                last_t = t
+                self.recorder.snapshot(self, start + t)
+                if stop_condition is not None and stop_condition():
+                    duration = t
+                    break
+        self.export_time = start + duration
+        self.recorder.snapshot(self, self.export_time)
+
+    def pause(self, duration=DEFAULT_WAIT_TIME):
+        self.wait(duration, frozen_frame=True)
+
+
+def export_scene(scene_cls, fps=15, precision=3):
+    """Run ``scene_cls.construct()`` and return its timeline as a dict."""
+    export_cls = type(f"{scene_cls.__name__}Export", (VectorExportMixin, scene_cls), {})
+    scene = export_cls()
+    recorder = TimelineRecorder(precision=precision)
+    scene.setup_export(recorder, fps)
+    scene.setup()
+    scene.construct()
+    return recorder.to_json(scene_cls.__name__, scene.export_time, fps)
+
+
+def video_size(scene_name):
+    for path in (VIDEO_FILES.get(scene_name), MEDIA_VIDEO_DIR / f"{scene_name}.mp4"):
+        if path is not None and path.exists():
+            return path.stat().st_size
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", default=SCENES)
+    parser.add_argument("--fps", type=int, default=15, help="keyframes sampled per second of animation")
+    parser.add_argument("--precision", type=int, default=3, help="decimals kept for coordinates")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT_DIR)
+    args = parser.parse_args()
+
+    # Nothing is rasterized; dry_run also makes Manim 0.22 open no output files
+    config.disable_caching = True
+    config.dry_run = True
+    args.out.mkdir(parents=True, exist_ok=True)
+
+    print(f"{'Scene':<28}{'keyframes':>10}{'JSON':>11}{'gzip':>11}{'mp4':>11}{'gzip/mp4':>10}")
+    for name in args.scenes:
+        timeline = export_scene(getattr(nerf_raymarching, name), args.fps, args.precision)
+        payload = json.dumps(timeline, separators=(",", ":")).encode("utf-8")
+        (args.out / f"{name}.json").write_bytes(payload)
+
+        packed = len(gzip.compress(payload, 9))
+        mp4 = video_size(name)
+        ratio = f"{packed / mp4:.1%}" if mp4 else "-"
+        mp4_text = f"{mp4 / 1024:.0f} KB" if mp4 else "-"
+        print(f"{name:<28}{len(timeline['keyframes']):>10}{len(payload) / 1024:>8.0f} KB"
+              f"{packed / 1024:>8.0f} KB{mp4_text:>11}{ratio:>10}")
+
+
+if __name__ == "__main__":
+    main()
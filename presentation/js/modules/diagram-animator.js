@@ -7,6 +7,31 @@ import gsap from 'gsap';
 
 // Store diagram instances
 const diagrams = new Map();
+const vectorTimelines = new Map();
+
+const SVG_NS = 'http://www.w3.org/2000/svg';
+
+// Short keys used in the exported JSON -> SVG attributes
+const PATH_ATTRIBUTES = {
+  d: 'd',
+  fill: 'fill',
+  fo: 'fill-opacity',
+  stroke: 'stroke',
+  so: 'stroke-opacity',
+  sw: 'stroke-width'
+};
+
+const IMAGE_ATTRIBUTES = {
+  x: 'x',
+  y: 'y',
+  w: 'width',
+  h: 'height',
+  o: 'opacity',
+  href: 'href'
+};
+
+// Attributes that can never be interpolated
+const DISCRETE_ATTRIBUTES = new Set(['href']);
 
 /**
  * Initialize diagram animations
@@ -23,11 +48,23 @@ export function initDiagramAnimator() {
     console.log(`Diagram animator initialized: ${diagramId}`);
   });
 
+  // Manim scenes exported by assets/manim/vector_export.py
+  document.querySelectorAll('[data-vector-timeline]').forEach((container, index) => {
+    const timelineId = container.id || `vector-timeline-${index}`;
+    const player = new VectorTimelinePlayer(container, container.dataset.vectorTimeline);
+    vectorTimelines.set(timelineId, player);
+
+    player.ready
+      .then(() => console.log(`Vector timeline loaded: ${timelineId}`))
+      .catch(error => console.error(`Error loading vector timeline ${timelineId}:`, error));
+  });
+
   // Expose global access
   window.diagramAnimator = {
     get: (id) => diagrams.get(id),
     playStep: (id, step) => diagrams.get(id)?.playStep(step),
-    reset: (id) => diagrams.get(id)?.reset()
+    reset: (id) => diagrams.get(id)?.reset(),
+    timeline: (id) => vectorTimelines.get(id)
   };
 }
 
@@ -155,6 +192,152 @@ class DiagramAnimator {
   }
 }
 
+/**
+ * VectorTimelinePlayer plays a Manim scene exported as JSON keyframes
+ * (see assets/manim/vector_export.py) as a resolution-independent SVG
+ */
+class VectorTimelinePlayer {
+  constructor(container, url) {
+    this.container = container;
+    this.url = url;
+    this.data = null;
+    this.svg = null;
+    this.elements = new Map();
+    this.timeline = null;
+
+    this.ready = this.load();
+  }
+
+  async load() {
+    const response = await fetch(this.url);
+    if (!response.ok) throw new Error(`Failed to load ${this.url}: ${response.status}`);
+    this.data = await response.json();
+
+    this.createSvg();
+    this.createTimeline();
+    return this;
+  }
+
+  createSvg() {
+    const { viewBox, background, shapes } = this.data;
+
+    this.svg = document.createElementNS(SVG_NS, 'svg');
+    this.svg.setAttribute('viewBox', viewBox.join(' '));
+    this.svg.setAttribute('preserveAspectRatio', 'xMidYMid meet');
+    this.svg.style.width = '100%';
+    this.svg.style.height = '100%';
+    this.svg.style.background = background;
+
+    // Paint order is fixed at export time, so elements are created once
+    shapes.forEach(shape => {
+      const el = document.createElementNS(SVG_NS, shape.type === 'image' ? 'image' : 'path');
+      el.style.display = 'none';
+      if (shape.type === 'image') {
+        el.setAttribute('preserveAspectRatio', 'none');
+      } else {
+        el.setAttribute('stroke-linejoin', 'round');
+        el.setAttribute('stroke-linecap', 'round');
+      }
+      this.svg.appendChild(el);
+      this.elements.set(shape.id, el);
+    });
+
+    this.container.appendChild(this.svg);
+  }
+
+  createTimeline() {
+    this.timeline = gsap.timeline({ paused: true });
+
+    const visible = new Set();
+    const pathNumbers = new Map();
+    let previousTime = 0;
+
+    this.data.keyframes.forEach(frame => {
+      const time = frame.t;
+
+      (frame.hide || []).forEach(id => {
+        this.timeline.set(this.elements.get(id), { display: 'none' }, time);
+        visible.delete(id);
+      });
+
+      Object.entries(frame.set || {}).forEach(([id, attrs]) => {
+        const el = this.elements.get(id);
+        const names = el.tagName === 'image' ? IMAGE_ATTRIBUTES : PATH_ATTRIBUTES;
+        const tweenable = visible.has(id) && time > previousTime;
+        const tweenVars = {};
+        const setVars = {};
+
+        Object.entries(attrs).forEach(([key, value]) => {
+          if (key === 't') {
+            (tweenable ? tweenVars : setVars).transform = `translate(${value[0]} ${value[1]})`;
+            return;
+          }
+
+          let canTween = tweenable && !DISCRETE_ATTRIBUTES.has(key);
+          if (key === 'd') {
+            // GSAP interpolates the numbers inside the string, which only
+            // works when both paths have the same structure
+            const count = (value.match(/-?[\d.]+/g) || []).length;
+            canTween = canTween && pathNumbers.get(id) === count;
+            pathNumbers.set(id, count);
+          }
+          (canTween ? tweenVars : setVars)[names[key]] = value;
+        });
+
+        // A new path resets the translation, so they must switch together
+        if (setVars.d !== undefined && tweenVars.transform !== undefined) {
+          setVars.transform = tweenVars.transform;
+          delete tweenVars.transform;
+        }
+
+        if (Object.keys(setVars).length) {
+          this.timeline.set(el, { attr: setVars }, time);
+        }
+        if (Object.keys(tweenVars).length) {
+          this.timeline.to(el, {
+            attr: tweenVars,
+            duration: time - previousTime,
+            ease: 'none'
+          }, previousTime);
+        }
+      });
+
+      (frame.show || []).forEach(id => {
+        this.timeline.set(this.elements.get(id), { display: 'inline' }, time);
+        visible.add(id);
+      });
+
+      previousTime = time;
+    });
+
+    // Mark every play() so slides can jump straight to a step
+    this.data.plays.forEach((play, index) => {
+      this.timeline.addLabel(`play${index}`, play.t);
+    });
+  }
+
+  play(from = null) {
+    if (from !== null) this.timeline.seek(from, false);
+    this.timeline.play();
+  }
+
+  pause() {
+    this.timeline.pause();
+  }
+
+  seek(time) {
+    this.timeline.seek(time, false);
+  }
+
+  restart() {
+    this.timeline.restart();
+  }
+
+  get duration() {
+    return this.data ? this.data.duration : 0;
+  }
+}
+
 /**
  * Animate pipeline arrows (draw effect)
  */
@@ -238,4 +421,4 @@ export function staggerFadeIn(elements, options = {}) {
 }
 
 // Export utilities
-export { DiagramAnimator };
+export { DiagramAnimator, VectorTimelinePlayer };